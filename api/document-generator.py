@@ -1,13 +1,16 @@
-import json
 import sys
 import os
+import re
 from http.server import BaseHTTPRequestHandler
 
 # Version: 2.0 - No fallback, PDF service only
 # Add parent directory to path to import ieee_generator_fixed
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.join(current_dir, '..')
-sys.path.insert(0, parent_dir)
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from json_utils import dumps_json, loads_json
 
 # Import ieee_generator_fixed - no fallback
 from ieee_generator_fixed import generate_ieee_document
@@ -22,8 +25,28 @@ except ImportError as e:
     print(f"⚠️ PDF service client not available: {e}", file=sys.stderr)
     PDF_SERVICE_AVAILABLE = False
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+
+def base64_decoded_size(data):
+    """
+    Return the decoded size in bytes of base64 data without decoding it
+    
+    Line breaks and other whitespace are ignored and padding is optional.
+    Raises ValueError if data is not valid base64.
+    """
+    data = _WHITESPACE_RE.sub('', data)
+    if not _BASE64_RE.fullmatch(data) or len(data.rstrip('=')) % 4 == 1:
+        raise ValueError("PDF data from the PDF service is not valid base64")
+    return len(data.rstrip('=')) * 3 // 4
+
+# Client reused across invocations of a warm function instance so its
+# requests.Session keeps the connection to the PDF service alive
+_pdf_service_client = None
+
 def get_pdf_service_client():
     """Get or create PDF service client with current environment variables"""
+    global _pdf_service_client
     try:
         PDF_SERVICE_URL = os.environ.get('PDF_SERVICE_URL', '')
         PDF_SERVICE_TIMEOUT = int(os.environ.get('PDF_SERVICE_TIMEOUT', '30'))
@@ -39,11 +62,19 @@ def get_pdf_service_client():
             print("❌ PDF_SERVICE_URL environment variable not set", file=sys.stderr)
             return None
         
+        client = _pdf_service_client
+        if (client is not None
+                and client.service_url == PDF_SERVICE_URL.rstrip('/')
+                and client.timeout == PDF_SERVICE_TIMEOUT):
+            print("♻️ Reusing PDF service client", file=sys.stderr)
+            return client
+        
         print(f"🔧 Creating PDFServiceClient with URL: {PDF_SERVICE_URL}", file=sys.stderr)
         client = PDFServiceClient(
             service_url=PDF_SERVICE_URL,
             timeout=PDF_SERVICE_TIMEOUT
         )
+        _pdf_service_client = client
         print(f"✅ PDF service client initialized successfully", file=sys.stderr)
         return client
     except Exception as e:
@@ -84,7 +115,7 @@ class handler(BaseHTTPRequestHandler):
             # Read request data
             content_length = int(self.headers.get('Content-Length', 0))
             post_data = self.rfile.read(content_length)
-            document_data = json.loads(post_data.decode('utf-8'))
+            document_data = loads_json(post_data)
             
             # Debug logging
             format_value = document_data.get('format')
@@ -117,6 +148,11 @@ class handler(BaseHTTPRequestHandler):
             # Generate preview using DOCX→PDF conversion (consistent formatting)
             print("🌐 Generating preview using DOCX→PDF conversion for consistent formatting...", file=sys.stderr)
             
+            # Reach the PDF service while the DOCX is being generated
+            pdf_client = get_pdf_service_client()
+            if pdf_client:
+                pdf_client.warm_up()
+            
             # Step 1: Generate DOCX document
             print("📄 Step 1: Generating DOCX document for preview...", file=sys.stderr)
             docx_bytes = generate_ieee_document(document_data)
@@ -127,15 +163,12 @@ class handler(BaseHTTPRequestHandler):
             print(f"✅ DOCX generated for preview (size: {len(docx_bytes)} bytes)", file=sys.stderr)
             
             # Step 2: Convert DOCX to PDF - PDF SERVICE ONLY (NO FALLBACK)
-            print("📄 Step 2: Initializing PDF service client...", file=sys.stderr)
-            pdf_client = get_pdf_service_client()
             if not pdf_client:
                 error_msg = "PDF service not configured. Set PDF_SERVICE_URL environment variable."
                 print(f"❌ {error_msg}", file=sys.stderr)
                 raise Exception(error_msg)
             
             print("📄 Step 2: Converting DOCX to PDF for preview using PDF service...", file=sys.stderr)
-            import base64
             
             # Call PDF service - NO FALLBACK
             print(f"🔧 Calling pdf_client.convert_to_pdf with {len(docx_bytes)} bytes...", file=sys.stderr)
@@ -145,13 +178,11 @@ class handler(BaseHTTPRequestHandler):
             if not response.success or not response.pdf_data:
                 raise Exception(f"PDF service conversion failed: {response.error}")
             
-            # Decode base64 PDF data from service
-            pdf_bytes = base64.b64decode(response.pdf_data)
+            # PDF data from the service is already base64, pass it through as-is
+            pdf_base64 = response.pdf_data
+            pdf_size = base64_decoded_size(pdf_base64)
             conversion_method = f"pdf_service_{response.conversion_method}"
-            print(f"✅ PDF preview generated via PDF service (size: {len(pdf_bytes)} bytes)", file=sys.stderr)
-            
-            # Convert to base64 for response
-            pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+            print(f"✅ PDF preview generated via PDF service (size: {pdf_size} bytes)", file=sys.stderr)
             
             # Send success response with PDF data
             self.send_response(200)
@@ -163,13 +194,13 @@ class handler(BaseHTTPRequestHandler):
                 'success': True,
                 'file_data': pdf_base64,
                 'file_type': 'application/pdf',
-                'file_size': len(pdf_bytes),
+                'file_size': pdf_size,
                 'message': 'PDF preview generated successfully via DOCX→PDF conversion',
                 'conversion_method': conversion_method,
                 'generator': 'ieee_generator_fixed.py'
             }
             
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self.wfile.write(dumps_json(response))
             
         except Exception as e:
             print(f"❌ EXCEPTION in do_POST: {e}", file=sys.stderr)
@@ -180,10 +211,13 @@ class handler(BaseHTTPRequestHandler):
     def handle_pdf_via_docx_conversion(self, document_data):
         """Handle PDF generation requests - PDF SERVICE ONLY (NO FALLBACK)"""
         try:
-            import base64
-            
             print("🎯 Starting PDF generation via DOCX→PDF conversion...", file=sys.stderr)
             
+            # Reach the PDF service while the DOCX is being generated
+            pdf_client = get_pdf_service_client()
+            if pdf_client:
+                pdf_client.warm_up()
+            
             # Step 1: Generate DOCX document
             print("📄 Step 1: Generating DOCX document...", file=sys.stderr)
             docx_bytes = generate_ieee_document(document_data)
@@ -194,7 +228,6 @@ class handler(BaseHTTPRequestHandler):
             print(f"✅ DOCX generated (size: {len(docx_bytes)} bytes)", file=sys.stderr)
             
             # Step 2: Convert DOCX to PDF - PDF SERVICE ONLY (NO FALLBACK)
-            pdf_client = get_pdf_service_client()
             if not pdf_client:
                 raise Exception("PDF service not configured. Set PDF_SERVICE_URL environment variable.")
             
@@ -206,13 +239,11 @@ class handler(BaseHTTPRequestHandler):
             if not response.success or not response.pdf_data:
                 raise Exception(f"PDF service conversion failed: {response.error}")
             
-            # Decode base64 PDF data from service
-            pdf_bytes = base64.b64decode(response.pdf_data)
+            # PDF data from the service is already base64, pass it through as-is
+            pdf_base64 = response.pdf_data
+            pdf_size = base64_decoded_size(pdf_base64)
             conversion_method = f"pdf_service_{response.conversion_method}"
-            print(f"✅ PDF generated via PDF service (size: {len(pdf_bytes)} bytes, method: {response.conversion_method})", file=sys.stderr)
-            
-            # Convert to base64 for JSON response
-            pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+            print(f"✅ PDF generated via PDF service (size: {pdf_size} bytes, method: {response.conversion_method})", file=sys.stderr)
             
             # Send success response with strict CORS
             self.send_response(200)
@@ -224,14 +255,14 @@ class handler(BaseHTTPRequestHandler):
                 'success': True,
                 'file_data': pdf_base64,
                 'file_type': 'application/pdf',
-                'file_size': len(pdf_bytes),
+                'file_size': pdf_size,
                 'message': 'PDF generated successfully via DOCX→PDF conversion',
                 'conversion_method': conversion_method,
                 'requested_format': 'pdf',
                 'actual_format': 'pdf'
             }
             
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self.wfile.write(dumps_json(response))
             
         except Exception as e:
             print(f"❌ PDF generation via DOCX→PDF conversion failed: {e}", file=sys.stderr)
@@ -268,14 +299,12 @@ class handler(BaseHTTPRequestHandler):
             if not response.success or not response.pdf_data:
                 raise Exception(f"PDF service conversion failed: {response.error}")
             
-            # Decode base64 PDF data from service
-            pdf_bytes = base64.b64decode(response.pdf_data)
+            # PDF data from the service is already base64, pass it through as-is
+            pdf_base64 = response.pdf_data
+            pdf_size = base64_decoded_size(pdf_base64)
             conversion_method = f"pdf_service_{response.conversion_method}"
             
-            print(f"✅ PDF service conversion successful, output size: {len(pdf_bytes)} bytes", file=sys.stderr)
-            
-            # Convert to base64 for JSON response
-            pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+            print(f"✅ PDF service conversion successful, output size: {pdf_size} bytes", file=sys.stderr)
             
             # Send success response with strict CORS
             self.send_response(200)
@@ -287,14 +316,14 @@ class handler(BaseHTTPRequestHandler):
                 'success': True,
                 'file_data': pdf_base64,
                 'file_type': 'application/pdf',
-                'file_size': len(pdf_bytes),
+                'file_size': pdf_size,
                 'message': 'PDF generated successfully via PDF service',
                 'conversion_method': conversion_method,
                 'requested_format': 'pdf',
                 'actual_format': 'pdf'
             }
             
-            self.wfile.write(json.dumps(response_data).encode('utf-8'))
+            self.wfile.write(dumps_json(response_data))
             
         except Exception as e:
             print(f"❌ PDF service conversion failed: {e}", file=sys.stderr)
@@ -328,7 +357,7 @@ class handler(BaseHTTPRequestHandler):
                 'message': 'DOCX document generated successfully'
             }
             
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self.wfile.write(dumps_json(response))
             
         except Exception as e:
             self.send_error_response(500, f'DOCX generation failed: {str(e)}')
@@ -360,4 +389,4 @@ class handler(BaseHTTPRequestHandler):
             'generator': 'ieee_generator_fixed.py'
         }
         
-        self.wfile.write(json.dumps(response).encode('utf-8'))
\ No newline at end of file
+        self.wfile.write(dumps_json(response))
\ No newline at end of file
@@ -11,9 +11,12 @@ from io import BytesIO
 from http.server import BaseHTTPRequestHandler
 
 # Import the generate function from the local IEEE generator
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.join(current_dir, '..')
-sys.path.insert(0, parent_dir)
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from json_utils import dumps_json, loads_json
 
 # Import the IEEE generator - this MUST work for proper formatting
 try:
@@ -69,7 +72,7 @@ class handler(BaseHTTPRequestHandler):
                 return
                 
             post_data = self.rfile.read(content_length)
-            document_data = json.loads(post_data.decode('utf-8'))
+            document_data = loads_json(post_data)
             
             # Validate required fields
             if not document_data.get('title'):
@@ -112,7 +115,6 @@ class handler(BaseHTTPRequestHandler):
             download_recorded = False
             try:
                 # Import database utilities
-                sys.path.insert(0, parent_dir)
                 from db_utils import record_download
                 
                 # Extract user info from request headers if available
@@ -144,15 +146,15 @@ class handler(BaseHTTPRequestHandler):
                 # Don't fail the request if database recording fails
             
             self.end_headers()
-            response = json.dumps({
+            response = {
                 'success': True,
                 'file_data': docx_base64,
                 'file_type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
                 'file_size': len(docx_bytes),
                 'message': 'DOCX document generated successfully',
                 'download_recorded': download_recorded
-            })
-            self.wfile.write(response.encode())
+            }
+            self.wfile.write(dumps_json(response))
             
         except json.JSONDecodeError as e:
             self.send_response(400)
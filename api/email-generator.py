@@ -15,9 +15,12 @@ from io import BytesIO
 from http.server import BaseHTTPRequestHandler
 
 # Import the generate function from the local IEEE generator
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.join(current_dir, '..')
-sys.path.insert(0, parent_dir)
+current_dir = os.path.dirname(__file__)
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from json_utils import loads_json
 
 try:
     from ieee_generator_fixed import generate_ieee_document
@@ -55,7 +58,7 @@ class handler(BaseHTTPRequestHandler):
                 return
                 
             post_data = self.rfile.read(content_length)
-            email_data = json.loads(post_data.decode('utf-8'))
+            email_data = loads_json(post_data)
             
             # Extract email and document data
             recipient_email = email_data.get('email')
@@ -174,7 +177,7 @@ class handler(BaseHTTPRequestHandler):
                     'message': f'IEEE paper sent successfully to {recipient_email}',
                     'email': recipient_email,
                     'document_title': document_data.get('title') if isinstance(document_data, dict) else document_title,
-                    'file_size': len(docx_buffer.getvalue())
+                    'file_size': len(buffer_content)
                 })
                 self.wfile.write(response.encode())
             else:
@@ -4,27 +4,45 @@ Tests database connectivity and system status
 """
 
 from http.server import BaseHTTPRequestHandler
+import hashlib
 import json
 import os
+import re
 import sys
+import time
 from datetime import datetime
+from pathlib import Path
 
 # Add the parent directory to the path to import db_utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PARENT_DIR = os.path.dirname(os.path.dirname(__file__))
+if PARENT_DIR not in sys.path:
+    sys.path.append(PARENT_DIR)
+
+# KEY=value pairs, one per line, optionally written as `export KEY = value`;
+# comment and blank lines never match
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*(?:export[ \t]+)?([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE
+)
+
+_ENV_LOADED = False
 
 # Load environment variables from .env.local if it exists
 def load_env():
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
     env_files = ['.env.local', '.env']
     for env_file in env_files:
-        env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), env_file)
-        if os.path.exists(env_path):
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key] = value
-            break
+        env_path = os.path.join(PARENT_DIR, env_file)
+        try:
+            env_text = Path(env_path).read_text()
+        except FileNotFoundError:
+            continue
+        os.environ.update(_ENV_LINE_RE.findall(env_text))
+        break
+    # Only mark the environment loaded once the read has succeeded, so a
+    # failed read is retried on the next call
+    _ENV_LOADED = True
 
 # Load environment variables
 load_env()
@@ -44,53 +62,34 @@ except ImportError as e:
     extract_token_from_request = None
     get_jwt_secret = None
 
+# Connect timeout for the health check database probe. libpq's minimum is 2s;
+# an unreachable database must not hold the check for the default 30s.
+DB_HEALTH_CONNECT_TIMEOUT = 2
+
+# Successful database probes are reused for this many seconds, keyed by a hash
+# of DATABASE_URL, and returned marked as cached with their age. Failures are
+# never cached so an outage shows up immediately.
+DB_PROBE_CACHE_TTL = 30
+_db_probe_cache = {}
+
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
         """Handle GET requests for health check"""
         try:
-            # System information (always available)
-            system_info = {
-                'python_version': sys.version,
-                'environment': os.environ.get('VERCEL_ENV', 'development'),
-                'timestamp': datetime.now().isoformat(),
-                'database_url_configured': bool(os.environ.get('DATABASE_URL')),
-                'jwt_secret_configured': bool(os.environ.get('JWT_SECRET')),
-                'service': 'format-a-python-backend',
-                'status': 'running'
-            }
-            
-            # Test JWT authentication (lightweight)
-            auth_result = self._test_jwt_auth()
-            
-            # Test database connection (with timeout protection)
-            db_result = self._test_database_with_timeout()
-            
-            # Overall health status - service is healthy if basic systems work
-            # Database issues shouldn't make the entire service unhealthy
-            is_healthy = auth_result.get('success', False)
-            
-            response_data = {
-                'success': True,  # Service is running
-                'status': 'healthy' if is_healthy else 'degraded',
-                'database': db_result,
-                'authentication': auth_result,
-                'system': system_info,
-                'timestamp': datetime.now().isoformat()
-            }
+            response_data = self._build_health_status()
             
             # Always return 200 for health checks unless there's a critical error
             self.send_response(200)
             self.send_header('Content-Type', 'application/json')
             
             # Import and use CORS utilities - no fallback
-            sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
             from cors_utils import set_cors_headers
             origin = self.headers.get('Origin')
             set_cors_headers(self, origin)
             
             self.end_headers()
             
-            self.wfile.write(json.dumps(response_data, indent=2).encode())
+            self.wfile.write(json.dumps(response_data).encode('utf-8'))
             
         except Exception as e:
             self.send_error_response(500, 'Health check failed', str(e))
@@ -102,6 +101,51 @@ class handler(BaseHTTPRequestHandler):
                 except:
                     pass  # Don't fail health check on cleanup issues
     
+    def do_HEAD(self):
+        """Handle HEAD requests as a cheap liveness probe, e.g. to warm a cold instance"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        
+        from cors_utils import set_cors_headers
+        origin = self.headers.get('Origin')
+        set_cors_headers(self, origin)
+        
+        self.end_headers()
+    
+    def _build_health_status(self):
+        """Collect system, authentication and database status for a health check"""
+        # System information (always available)
+        system_info = {
+            'python_version': sys.version,
+            'environment': os.environ.get('VERCEL_ENV', 'development'),
+            'timestamp': datetime.now().isoformat(),
+            'database_url_configured': bool(os.environ.get('DATABASE_URL')),
+            'jwt_secret_configured': bool(os.environ.get('JWT_SECRET')),
+            'service': 'format-a-python-backend',
+            'status': 'running'
+        }
+        
+        # Test JWT authentication (lightweight)
+        auth_result = self._test_jwt_auth()
+        
+        # Test database connection (with timeout protection)
+        db_result = self._test_database_with_timeout()
+        
+        # Overall health status - service is healthy if basic systems work
+        # Database issues shouldn't make the entire service unhealthy
+        is_healthy = auth_result.get('success', False)
+        
+        response_data = {
+            'success': True,  # Service is running
+            'status': 'healthy' if is_healthy else 'degraded',
+            'database': db_result,
+            'authentication': auth_result,
+            'system': system_info,
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        return response_data
+    
     def _test_database_with_timeout(self):
         """Test database connection with basic error handling"""
         if not test_connection:
@@ -112,8 +156,21 @@ class handler(BaseHTTPRequestHandler):
             }
         
         try:
-            # Simple database test without complex timeout handling
-            db_result = test_connection()
+            cache_key = hashlib.blake2b(
+                os.environ.get('DATABASE_URL', '').encode(), digest_size=16
+            ).digest()
+            cached = _db_probe_cache.get(cache_key)
+            if cached:
+                cache_age = time.monotonic() - cached[1]
+                if cache_age < DB_PROBE_CACHE_TTL:
+                    return {**cached[0], 'cached': True, 'cacheAgeSeconds': round(cache_age, 1)}
+            
+            # Fail fast if a new connection has to be opened
+            db_result = test_connection(connect_timeout=DB_HEALTH_CONNECT_TIMEOUT)
+            if db_result.get('success'):
+                _db_probe_cache[cache_key] = (db_result, time.monotonic())
+            else:
+                _db_probe_cache.pop(cache_key, None)
             return db_result
             
         except Exception as e:
@@ -210,6 +267,11 @@ class handler(BaseHTTPRequestHandler):
                 result = self._handle_performance_metrics()
                 self.send_success_response(result)
                 
+            # ADVANCED FEATURES - MULTIPLE ACTIONS IN ONE ROUND-TRIP
+            elif action == 'multi':
+                result = self._handle_multi_request(data)
+                self.send_success_response(result)
+                
             else:
                 self.send_error_response(400, "Invalid action", f"Action '{action}' not supported")
                 
@@ -218,6 +280,57 @@ class handler(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_error_response(500, "Processing error", str(e))
     
+    def _handle_multi_request(self, data):
+        """Run several read-only actions and return their results in request order"""
+        sub_requests = data.get('requests', [])
+        
+        if not isinstance(sub_requests, list):
+            raise ValueError("requests must be a list of {'action': ...} objects")
+        
+        if not sub_requests:
+            raise ValueError("No requests provided")
+        
+        # Validate batch size (Vercel constraints)
+        max_batch_size = 10
+        if len(sub_requests) > max_batch_size:
+            raise ValueError(f"Batch size {len(sub_requests)} exceeds maximum {max_batch_size}")
+        
+        handlers = {
+            'health': lambda sub: self._build_health_status(),
+            'validate_file': self._handle_file_validation,
+            'performance': lambda sub: self._handle_performance_metrics(),
+        }
+        
+        results = []
+        try:
+            for sub in sub_requests:
+                action = sub.get('action') if isinstance(sub, dict) else None
+                sub_handler = handlers.get(action)
+                if not sub_handler:
+                    results.append({
+                        'action': action,
+                        'success': False,
+                        'error': f"Action '{action}' not supported in multi requests"
+                    })
+                    continue
+                
+                try:
+                    results.append({'action': action, 'success': True, 'data': sub_handler(sub)})
+                except Exception as e:
+                    results.append({'action': action, 'success': False, 'error': str(e)})
+        finally:
+            # Cleanup connection for serverless if a health check opened one
+            if cleanup_connection:
+                try:
+                    cleanup_connection()
+                except:
+                    pass
+        
+        return {
+            'results': results,
+            'count': len(results)
+        }
+    
     def _handle_batch_processing(self, data):
         """Handle batch document processing"""
         import time
@@ -530,11 +643,10 @@ class handler(BaseHTTPRequestHandler):
             'timestamp': datetime.now().isoformat()
         }
         
-        self.wfile.write(json.dumps(response, indent=2).encode())
+        self.wfile.write(json.dumps(response).encode('utf-8'))
     
     def do_OPTIONS(self):
         """Handle CORS preflight requests - no fallback"""
-        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         from cors_utils import handle_preflight
         origin = self.headers.get('Origin')
         handle_preflight(self, origin)
@@ -557,4 +669,4 @@ class handler(BaseHTTPRequestHandler):
             'timestamp': datetime.now().isoformat()
         }
         
-        self.wfile.write(json.dumps(error_response, indent=2).encode())
\ No newline at end of file
+        self.wfile.write(json.dumps(error_response).encode('utf-8'))
\ No newline at end of file
@@ -6,8 +6,9 @@ Provides JWT token validation matching the Node.js auth system
 import jwt
 import os
 import json
+import time
 from typing import Optional, Dict, Any
-from functools import wraps
+from functools import lru_cache, wraps
 
 
 def get_jwt_secret() -> str:
@@ -15,6 +16,17 @@ def get_jwt_secret() -> str:
     return os.environ.get('JWT_SECRET', 'fallback-secret-change-in-production')
 
 
+@lru_cache(maxsize=256)
+def _decode_jwt_token(token: str, jwt_secret: str) -> Dict[str, Any]:
+    """
+    Verify and decode a JWT token, memoizing successful decodes
+    
+    Failed decodes raise and are therefore never cached. Expiry of cached
+    payloads is re-checked by the caller on every use.
+    """
+    return jwt.decode(token, jwt_secret, algorithms=['HS256'])
+
+
 def validate_jwt_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Validate JWT token using the same secret as Node.js functions
@@ -35,7 +47,12 @@ def validate_jwt_token(token: str) -> Optional[Dict[str, Any]]:
             token = token[7:]
             
         jwt_secret = get_jwt_secret()
-        decoded = jwt.decode(token, jwt_secret, algorithms=['HS256'])
+        decoded = _decode_jwt_token(token, jwt_secret)
+        
+        # A cached payload may have expired since it was first verified
+        exp = decoded.get('exp')
+        if exp is not None and exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
         
         # Validate required fields
         required_fields = ['userId', 'email', 'name']
@@ -44,7 +61,7 @@ def validate_jwt_token(token: str) -> Optional[Dict[str, Any]]:
                 print(f"Missing required field in token: {field}")
                 return None
                 
-        return decoded
+        return dict(decoded)
         
     except jwt.ExpiredSignatureError:
         print("Token has expired")
@@ -0,0 +1,54 @@
+"""
+Shared pytest configuration and fixtures for the backend test suite
+"""
+
+import os
+import sys
+import pytest
+
+# Make the backend modules importable from every test module
+# (__file__ is already absolute on the Python 3.11 runtime, so no abspath)
+current_dir = os.path.dirname(__file__)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from ieee_generator_fixed import generate_ieee_document
+from pdf_service_client import PDFServiceClient
+
+# Document sent by the frontend in every integration test; treated as read-only
+DOCUMENT_DATA = {
+    'title': 'Integration Test Paper',
+    'authors': (
+        {'name': 'Test Author 1', 'email': 'author1@test.com', 'affiliation': 'Test University'},
+        {'name': 'Test Author 2', 'email': 'author2@test.com', 'affiliation': 'Test Institute'},
+    ),
+    'abstract': 'This is a test abstract for integration testing.'
+}
+
+
+def pytest_configure(config):
+    """Register custom markers so `pytest -m "not slow"` runs without warnings"""
+    config.addinivalue_line(
+        "markers",
+        "slow: builds a real DOCX with python-docx (deselect with -m \"not slow\")"
+    )
+
+
+@pytest.fixture(scope="session")
+def docx_bytes():
+    """
+    One generated IEEE DOCX shared by every test in the session.
+    
+    The tests only need real DOCX bytes to hand to the (mocked) PDF service,
+    so the document is built once instead of once per test. Tests can rely on
+    it being non-empty bytes; that contract is checked here, once.
+    """
+    result = generate_ieee_document(DOCUMENT_DATA)
+    assert isinstance(result, bytes) and result
+    return result
+
+
+@pytest.fixture
+def pdf_client():
+    """PDF service client pointed at a test URL; tests patch its conversion calls"""
+    return PDFServiceClient(service_url='http://test-service.com')
@@ -30,8 +30,14 @@ class DatabaseConnection:
             'retry_delay': 1
         }
         
-    def get_connection(self):
-        """Get database connection with lazy initialization"""
+    def get_connection(self, connect_timeout: Optional[int] = None):
+        """
+        Get database connection with lazy initialization
+        
+        Args:
+            connect_timeout: Seconds to wait when a new connection has to be
+                opened (defaults to connection_config['connect_timeout'])
+        """
         if not self._connection or self._connection.closed:
             database_url = os.environ.get('DATABASE_URL')
             if not database_url:
@@ -41,7 +47,7 @@ class DatabaseConnection:
                 self._connection = psycopg2.connect(
                     database_url,
                     cursor_factory=psycopg2.extras.RealDictCursor,
-                    connect_timeout=self.connection_config['connect_timeout']
+                    connect_timeout=connect_timeout or self.connection_config['connect_timeout']
                 )
                 self._connection.autocommit = True
                 logger.info("✅ Database connection established")
@@ -61,15 +67,19 @@ class DatabaseConnection:
 # Global database instance
 db = DatabaseConnection()
 
-def test_connection() -> Dict[str, Any]:
+def test_connection(connect_timeout: Optional[int] = None) -> Dict[str, Any]:
     """
     Test database connection and return health status
     Replicates the testConnection method from Node.js backend
+    
+    Args:
+        connect_timeout: Optional connect timeout in seconds, so callers such
+            as health checks can fail fast when the database is unreachable
     """
     start_time = datetime.now()
     
     try:
-        conn = db.get_connection()
+        conn = db.get_connection(connect_timeout=connect_timeout)
         cursor = conn.cursor()
         cursor.execute("SELECT 1 as test")
         result = cursor.fetchone()
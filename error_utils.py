@@ -47,6 +47,22 @@ class APIError(Exception):
         self.timestamp = datetime.now().isoformat()
         super().__init__(self.message)
 
+# Longest rendering of an error context written to the log
+MAX_LOGGED_CONTEXT_CHARS = 2000
+
+_context_encoder = json.JSONEncoder(default=str)
+
+def _preview_json(data: Any, limit: int = MAX_LOGGED_CONTEXT_CHARS) -> str:
+    """Serialize data for logging, stopping as soon as limit characters are produced"""
+    chunks = []
+    size = 0
+    for chunk in _context_encoder.iterencode(data):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return ''.join(chunks)[:limit] + '...'
+    return ''.join(chunks)
+
 class ErrorLogger:
     """Centralized error logging with context and metrics"""
     
@@ -70,7 +86,7 @@ class ErrorLogger:
         
         # Log to console with structured format
         logger.error(f"ERROR: {error_data['error_type']} - {error_data['message']}")
-        logger.error(f"Context: {json.dumps(error_data['context'], indent=2)}")
+        logger.error(f"Context: {_preview_json(error_data['context'])}")
         logger.error(f"Stack trace: {error_data['stack_trace']}")
         
         # Track error counts for monitoring
@@ -134,7 +150,6 @@ def send_error_response(handler: BaseHTTPRequestHandler, error: Exception,
     
     # Add CORS headers
     try:
-        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
         from cors_utils import set_cors_headers
         origin = handler.headers.get('Origin')
         set_cors_headers(handler, origin)
@@ -165,7 +180,7 @@ def send_error_response(handler: BaseHTTPRequestHandler, error: Exception,
             'context': context or {}
         }
     
-    handler.wfile.write(json.dumps(error_response, indent=2).encode())
+    handler.wfile.write(json.dumps(error_response).encode('utf-8'))
 
 def send_success_response(handler: BaseHTTPRequestHandler, data: Any = None, 
                          message: str = None, status_code: int = 200):
@@ -176,7 +191,6 @@ def send_success_response(handler: BaseHTTPRequestHandler, data: Any = None,
     
     # Add CORS headers
     try:
-        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
         from cors_utils import set_cors_headers
         origin = handler.headers.get('Origin')
         set_cors_headers(handler, origin)
@@ -194,7 +208,7 @@ def send_success_response(handler: BaseHTTPRequestHandler, data: Any = None,
         'timestamp': datetime.now().isoformat()
     }
     
-    handler.wfile.write(json.dumps(response, indent=2).encode())
+    handler.wfile.write(json.dumps(response).encode('utf-8'))
 
 def with_error_handling(func):
     """Decorator to add comprehensive error handling to endpoint functions"""
@@ -2,14 +2,13 @@
 IEEE Document Generator - EXACT copy from test.py
 """
 
-import base64
 import json
 import os
 import re
 import sys
-import tempfile
 import unicodedata
 from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from docx import Document
 from docx.enum.section import WD_SECTION
@@ -19,6 +18,19 @@ from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Inches, Pt
 
+# save_docx_bytes drives python-docx's private PackageWriter steps to choose
+# the compression of each part; Document.save is used if they are missing
+try:
+    from docx.opc.pkgwriter import PackageWriter
+except ImportError:
+    PackageWriter = None
+
+# pybase64 decodes embedded images with SIMD kernels; fall back to the stdlib
+try:
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
 # Import LaTeX equation converter
 try:
     from latex_equation_converter import insert_latex_equation, format_latex_for_display
@@ -29,6 +41,17 @@ except ImportError as e:
     print(f"⚠️ LaTeX equation converter not available: {e}", file=sys.stderr)
 
 
+# Line-breaking tags become newlines (closing </div> and </p> are dropped) before
+# the generic tag strip, so a literal "<" in the text cannot swallow them
+_LINE_BREAK_TAG_RE = re.compile(r'<(?:(br\s*/?|div|p)|/div|/p)>', re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_HTML_ENTITIES = {'&nbsp;': ' ', '&lt;': '<', '&gt;': '>', '&amp;': '&', '&quot;': '"'}
+_HTML_ENTITY_RE = re.compile('|'.join(_HTML_ENTITIES))
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]")
+_INLINE_WHITESPACE_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+
 def sanitize_text(text):
     """Sanitize text to remove HTML tags, invalid Unicode characters and surrogates."""
     if not text:
@@ -37,22 +60,14 @@ def sanitize_text(text):
     # Convert to string if not already
     text = str(text)
 
-    # CRITICAL FIX: Convert <br> and <br/> tags to newlines BEFORE removing other HTML tags
-    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'<div>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'</div>', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'<p>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'</p>', '', text, flags=re.IGNORECASE)
+    # CRITICAL FIX: Convert <br>, <div> and <p> tags to newlines BEFORE removing other HTML tags
+    text = _LINE_BREAK_TAG_RE.sub(lambda m: '\n' if m.group(1) else '', text)
     
     # CRITICAL: Remove ALL other HTML tags (including <span>, etc.)
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _HTML_TAG_RE.sub('', text)
     
-    # Remove HTML entities
-    text = text.replace('&nbsp;', ' ')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&quot;', '"')
+    # Decode HTML entities in a single pass
+    text = _HTML_ENTITY_RE.sub(lambda m: _HTML_ENTITIES[m.group(0)], text)
 
     # Remove surrogate characters and other problematic Unicode
     text = text.encode("utf-8", "ignore").decode("utf-8")
@@ -61,24 +76,45 @@ def sanitize_text(text):
     text = unicodedata.normalize("NFKD", text)
 
     # Remove any remaining control characters except newlines and tabs
-    text = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]", "", text)
+    text = _CONTROL_CHARS_RE.sub("", text)
     
     # Clean up multiple spaces on same line, but preserve newlines
-    text = re.sub(r'[ \t]+', ' ', text)
+    text = _INLINE_WHITESPACE_RE.sub(' ', text)
     # Clean up multiple consecutive newlines (max 2 newlines = 1 blank line)
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
     text = text.strip()
 
     return text
 
 
-def add_image_with_proper_layout(doc, image_data, width, caption_text="", figure_number=""):
+def strip_data_uri_prefix(image_data):
+    """Return the base64 payload of a data URI, or image_data if it has no prefix"""
+    # partition stops at the comma ending the short "data:...;base64" header
+    # instead of splitting (and copying) the whole payload
+    _, sep, payload = image_data.partition(",")
+    return payload if sep else image_data
+
+
+def decode_image_data(image_data, image_cache=None):
+    """Decode base64 image data, with or without a data URI prefix.
+    
+    Documents often embed the same image several times. Pass one dict as
+    image_cache for every image of a document so each distinct encoded string
+    is decoded once; the dict only lives as long as that document's build.
+    """
+    if image_cache is None:
+        return b64decode(strip_data_uri_prefix(image_data))
+    image_bytes = image_cache.get(image_data)
+    if image_bytes is None:
+        image_bytes = image_cache[image_data] = b64decode(strip_data_uri_prefix(image_data))
+    return image_bytes
+
+
+def add_image_with_proper_layout(doc, image_data, width, caption_text="", figure_number="", image_cache=None):
     """Add image with proper layout optimized for 2-column IEEE format."""
     try:
         # Decode base64 image data
-        if "," in image_data:
-            image_data = image_data.split(",")[1]
-        image_bytes = base64.b64decode(image_data)
+        image_bytes = decode_image_data(image_data, image_cache)
         image_stream = BytesIO(image_bytes)
         
         # Ensure width fits within 2-column layout constraints
@@ -241,10 +277,35 @@ IEEE_CONFIG = {
     },
     "min_table_width": Inches(1.5),    # Minimum table width
     "max_table_width": Inches(3.0),    # Maximum table width (fits in column)
+    # Image tables - CONSERVATIVE SIZING TO PREVENT OVERLAP in 2-column layout
+    "image_table_sizes": {
+        "small": Inches(1.0),   # Very conservative for 2-column
+        "medium": Inches(1.4),  # Conservative for 2-column
+        "large": Inches(1.8),   # Max conservative for 2-column
+    },
     # Reference specifications
     "reference_hanging_indent": 360,  # 0.25" hanging indent
 }
 
+# Structured author affiliation fields in IEEE order
+AFFILIATION_FIELDS = (
+    "department",
+    "organization",
+    "university",
+    "institution",
+    "city",
+    "state",
+    "country",
+)
+
+# CSS widths for figures and image tables in the document model
+MODEL_IMAGE_WIDTHS = {
+    "very-small": "1.5in",
+    "small": "2.0in",
+    "medium": "2.5in",
+    "large": "3.3125in",
+}
+
 
 def set_document_defaults(doc):
     """Set document-wide defaults using EXACT IEEE LaTeX PDF specifications via OpenXML."""
@@ -524,18 +585,8 @@ def add_authors(doc, authors):
             name_para.paragraph_format.space_after = Pt(3)
 
             # Handle individual fields - department, organization, city, etc.
-            fields = [
-                ("department", "Department"),
-                ("organization", "Organization"),
-                ("university", "University"),
-                ("institution", "Institution"),
-                ("city", "City"),
-                ("state", "State"),
-                ("country", "Country"),
-            ]
-
             # Add each field as a separate line if present
-            for field_key, field_name in fields:
+            for field_key in AFFILIATION_FIELDS:
                 if author.get(field_key):
                     field_para = cell.add_paragraph()
                     field_run = field_para.add_run(sanitize_text(author[field_key]))
@@ -553,9 +604,7 @@ def add_authors(doc, authors):
                     affiliation_lines = affiliation_text.strip().split("\n")
                     for line in affiliation_lines:
                         line = line.strip()
-                        if line and not line.lower().startswith(
-                            "email"
-                        ):  # Skip email lines here
+                        if line and line[:5].lower() != "email":  # Skip email lines here
                             affil_para = cell.add_paragraph()
                             affil_run = affil_para.add_run(sanitize_text(line))
                             affil_run.italic = (
@@ -941,7 +990,7 @@ def add_ieee_body_paragraph(doc, html_content):
         return para
 
 
-def add_ieee_table(doc, table_data, section_idx, table_count):
+def add_ieee_table(doc, table_data, section_idx, table_count, image_cache=None):
     """COMPREHENSIVE TABLE VISIBILITY FIX - Ensures tables are 100% visible in Word documents."""
     try:
         table_type = table_data.get("tableType", table_data.get("type", "interactive"))
@@ -1310,11 +1359,7 @@ def add_ieee_table(doc, table_data, section_idx, table_count):
                 try:
                     print("🔧 Processing image table for 2-column layout...", file=sys.stderr)
                     
-                    image_data = table_data["data"]
-                    if "," in image_data:
-                        image_data = image_data.split(",")[1]
-
-                    image_bytes = base64.b64decode(image_data)
+                    image_bytes = decode_image_data(table_data["data"], image_cache)
                     image_stream = BytesIO(image_bytes)
 
                     # Add spacing before image
@@ -1333,12 +1378,8 @@ def add_ieee_table(doc, table_data, section_idx, table_count):
 
                     # Size for 2-column layout compatibility - CONSERVATIVE SIZING TO PREVENT OVERLAP
                     size = table_data.get("size", "medium")
-                    size_mapping = {
-                        "small": Inches(1.0),   # Very conservative for 2-column
-                        "medium": Inches(1.4),  # Conservative for 2-column
-                        "large": Inches(1.8),   # Max conservative for 2-column
-                    }
-                    width = size_mapping.get(size, Inches(1.4))
+                    size_mapping = IEEE_CONFIG["image_table_sizes"]
+                    width = size_mapping.get(size, size_mapping["medium"])
                     
                     print(f"📏 Image table size '{size}' mapped to width: {width}", file=sys.stderr)
 
@@ -1439,7 +1480,7 @@ def add_justified_paragraph(
     return add_ieee_body_paragraph(doc, text)
 
 
-def add_section(doc, section_data, section_idx, is_first_section=False):
+def add_section(doc, section_data, section_idx, is_first_section=False, image_cache=None):
     """Add a section with content blocks, subsections, and figures - EXACT same as test.py."""
     if section_data.get("title"):
         # Create section heading with exact IEEE LaTeX formatting
@@ -1478,10 +1519,15 @@ def add_section(doc, section_data, section_idx, is_first_section=False):
         "content_blocks", []
     )
 
-    # Track table count for numbering
+    # Track table and image counts for numbering
     table_count = 0
+    image_count = 0
 
     for block_idx, block in enumerate(content_blocks):
+        # Running tally of image blocks so far, instead of rescanning the block list
+        if block.get("type") == "image":
+            image_count += 1
+
         # Check for text blocks with attached images FIRST (before text-only blocks)
         if block.get("type") == "text" and block.get("data"):
             # Handle text blocks with attached images (React frontend pattern)
@@ -1489,8 +1535,6 @@ def add_section(doc, section_data, section_idx, is_first_section=False):
             print(f"Processing text block with attached image in section {section_idx}", file=sys.stderr)
             
             # Handle image attached to text block
-            import base64
-
             size = block.get("size", "medium")
             # Get image size from config (frontend uses lowercase keys)
             size_mapping = IEEE_CONFIG["figure_sizes"]
@@ -1498,15 +1542,9 @@ def add_section(doc, section_data, section_idx, is_first_section=False):
 
             # Decode base64 image data
             try:
-                image_data = block["data"]
-
-                # Handle base64 data - remove prefix if present
-                if "," in image_data:
-                    image_data = image_data.split(",")[1]
-
-                # Decode base64 image data
+                # Decode base64 image data, removing the data URI prefix if present
                 try:
-                    image_bytes = base64.b64decode(image_data)
+                    image_bytes = decode_image_data(block["data"], image_cache)
                 except Exception as e:
                     print(
                         f"ERROR: Failed to decode image data in text block: {str(e)}",
@@ -1551,11 +1589,7 @@ def add_section(doc, section_data, section_idx, is_first_section=False):
                     run.add_text(f"[Image: {block.get('caption', 'Figure')}]")
 
                 # Generate figure number and add simple caption
-                img_count = sum(
-                    1
-                    for b in content_blocks[: block_idx + 1]
-                    if b.get("type") == "image"
-                )
+                img_count = image_count
                 
                 # Add figure caption with simple formatting (use default if no caption provided)
                 caption_text = block.get('caption', '').strip() or f"Figure {img_count}"
@@ -1591,7 +1625,11 @@ def add_section(doc, section_data, section_idx, is_first_section=False):
             table_count += 1
             
             print(f"🔧 Processing table block in section {section_idx}, table {table_count}", file=sys.stderr)
-            print(f"📊 Table block data: {block}", file=sys.stderr)
+            # Log the shape only; image tables carry their whole base64 payload
+            print(
+                f"📊 Table block type: {block.get('tableType', 'interactive')}, keys: {list(block)}",
+                file=sys.stderr,
+            )
 
             # COMPREHENSIVE CAPTION HANDLING - Support all possible caption fields
             caption_text = (
@@ -1614,7 +1652,7 @@ def add_section(doc, section_data, section_idx, is_first_section=False):
             caption_para.paragraph_format.space_after = Pt(6)
 
             # Add the table content with comprehensive visibility fixes
-            success = add_ieee_table(doc, block, section_idx, table_count)
+            success = add_ieee_table(doc, block, section_idx, table_count, image_cache)
             
             if success:
                 print(f"✅ Successfully completed table {table_count} in section {section_idx}", file=sys.stderr)
@@ -1624,9 +1662,7 @@ def add_section(doc, section_data, section_idx, is_first_section=False):
         elif block.get("type") == "image" and block.get("data"):
             # Handle image blocks - CLEAN & SIMPLE approach
             # FIXED: Don't require caption - use default if not provided
-            img_count = sum(
-                1 for b in content_blocks[: block_idx + 1] if b.get("type") == "image"
-            )
+            img_count = image_count
 
             print(f"Processing image block in section {section_idx}, image {img_count}", file=sys.stderr)
 
@@ -1646,12 +1682,8 @@ def add_section(doc, section_data, section_idx, is_first_section=False):
             figure_number = f"FIG. {section_idx}.{img_count}"
 
             try:
-                import base64
                 # Decode image
-                image_data = block["data"]
-                if "," in image_data:
-                    image_data = image_data.split(",")[1]
-                image_bytes = base64.b64decode(image_data)
+                image_bytes = decode_image_data(block["data"], image_cache)
                 image_stream = BytesIO(image_bytes)
 
                 # DYNAMIC SPACING: Calculate spacing based on image size
@@ -2352,9 +2384,11 @@ def generate_ieee_document(form_data):
     add_abstract(doc, form_data.get("abstract", ""))
     add_keywords(doc, form_data.get("keywords", ""))
 
-    # Add sections with EXACT IEEE LaTeX formatting
+    # Add sections with EXACT IEEE LaTeX formatting; images repeated anywhere
+    # in this document are decoded once
+    image_cache = {}
     for idx, section_data in enumerate(form_data.get("sections", []), 1):
-        add_section(doc, section_data, idx, is_first_section=(idx == 1))
+        add_section(doc, section_data, idx, is_first_section=(idx == 1), image_cache=image_cache)
 
     # NOTE: Standalone tables and figures are IGNORED
     # Images and tables must be added within section contentBlocks only
@@ -2368,9 +2402,52 @@ def generate_ieee_document(form_data):
     set_compatibility_options(doc)
 
     # Generate final document
+    return save_docx_bytes(doc)
+
+
+# Package parts in these formats are already compressed; deflating them again
+# takes about a third of the save time for figure-heavy papers and gains nothing
+STORED_PART_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "gif"})
+
+
+class DocxZipWriter:
+    """Zip writer for python-docx packages that stores image parts uncompressed"""
+
+    def __init__(self, pkg_file):
+        self._zipf = ZipFile(pkg_file, "w", compression=ZIP_DEFLATED)
+
+    def write(self, pack_uri, blob):
+        if pack_uri.ext.lower() in STORED_PART_EXTENSIONS:
+            compress_type = ZIP_STORED
+        else:
+            compress_type = ZIP_DEFLATED
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=compress_type)
+
+    def close(self):
+        self._zipf.close()
+
+
+_PACKAGE_WRITER_STEPS = ("_write_content_types_stream", "_write_pkg_rels", "_write_parts")
+
+
+def save_docx_bytes(doc):
+    """Serialize doc to DOCX bytes, mirroring python-docx's OpcPackage.save"""
+    if PackageWriter is None or not all(hasattr(PackageWriter, step) for step in _PACKAGE_WRITER_STEPS):
+        buffer = BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+
+    package = doc.part.package
+    parts = package.parts
+    for part in parts:
+        part.before_marshal()
+
     buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
+    writer = DocxZipWriter(buffer)
+    PackageWriter._write_content_types_stream(writer, parts)
+    PackageWriter._write_pkg_rels(writer, package.rels)
+    PackageWriter._write_parts(writer, parts)
+    writer.close()
     return buffer.getvalue()
 
 
@@ -2458,8 +2535,7 @@ def build_document_model(form_data):
                 }
                 
                 # Add structured fields in IEEE order
-                fields = ["department", "organization", "university", "institution", "city", "state", "country"]
-                for field in fields:
+                for field in AFFILIATION_FIELDS:
                     if author.get(field):
                         author_data["fields"].append({
                             "type": "affiliation",
@@ -2564,22 +2640,13 @@ def build_document_model(form_data):
                 
                 elif table_type == "image" and block.get("data"):
                     table_count += 1
-                    image_data = block["data"]
-                    if "," in image_data:
-                        image_data = image_data.split(",")[1]
-                    
-                    size_mapping = {
-                        "very-small": "1.5in",
-                        "small": "2.0in", 
-                        "medium": "2.5in",
-                        "large": "3.3125in"
-                    }
+                    image_data = strip_data_uri_prefix(block["data"])
                     
                     table_image_data = {
                         "type": "table_image",
                         "number": f"{section_idx}.{table_count}",
                         "data": image_data,
-                        "width": size_mapping.get(block.get("size", "medium"), "2.5in"),
+                        "width": MODEL_IMAGE_WIDTHS.get(block.get("size", "medium"), "2.5in"),
                         "text_align": "center",
                         "margin": "12pt 0",
                         "caption": {
@@ -2596,22 +2663,13 @@ def build_document_model(form_data):
             
             elif block_type == "image" and block.get("data") and block.get("caption"):
                 img_count += 1
-                image_data = block["data"]
-                if "," in image_data:
-                    image_data = image_data.split(",")[1]
-                
-                size_mapping = {
-                    "very-small": "1.5in",
-                    "small": "2.0in",
-                    "medium": "2.5in", 
-                    "large": "3.3125in"
-                }
+                image_data = strip_data_uri_prefix(block["data"])
                 
                 image_block_data = {
                     "type": "figure",
                     "number": f"{section_idx}.{img_count}",
                     "data": image_data,
-                    "width": size_mapping.get(block.get("size", "medium"), "2.5in"),
+                    "width": MODEL_IMAGE_WIDTHS.get(block.get("size", "medium"), "2.5in"),
                     "text_align": "center",
                     "margin": "12pt 0",
                     "caption": {
@@ -3320,16 +3378,7 @@ def generate_ieee_master_html(form_data):
                 author_html = f'<div class="ieee-author"><div class="author-name">{author_name}</div>'
 
                 # Add structured affiliation fields in IEEE order
-                fields = [
-                    "department",
-                    "organization",
-                    "university",
-                    "institution",
-                    "city",
-                    "state",
-                    "country",
-                ]
-                for field in fields:
+                for field in AFFILIATION_FIELDS:
                     if author.get(field):
                         author_html += f'<div class="author-affiliation">{sanitize_text(author[field])}</div>'
 
@@ -3338,7 +3387,7 @@ def generate_ieee_master_html(form_data):
                     author_html += f'<div class="author-email">{sanitize_text(author["email"])}</div>'
 
                 # Fallback to affiliation field if structured fields not available
-                if not any(author.get(field) for field in fields) and author.get(
+                if not any(author.get(field) for field in AFFILIATION_FIELDS) and author.get(
                     "affiliation"
                 ):
                     affiliation_lines = author["affiliation"].strip().split("\n")
@@ -3415,9 +3464,11 @@ def generate_ieee_master_html(form_data):
                         table_name = block.get("tableName", "").strip()
 
                         if caption_text and table_name:
-                            if table_name.lower() in caption_text.lower():
+                            caption_lower = caption_text.lower()
+                            name_lower = table_name.lower()
+                            if name_lower in caption_lower:
                                 final_caption = caption_text
-                            elif caption_text.lower() in table_name.lower():
+                            elif caption_lower in name_lower:
                                 final_caption = table_name
                             else:
                                 final_caption = caption_text
@@ -3431,9 +3482,7 @@ def generate_ieee_master_html(form_data):
 
                 elif table_type == "image" and block.get("data"):
                     # Handle image tables - ENSURE PROPER DISPLAY IN WORD
-                    image_data = block["data"]
-                    if "," in image_data:
-                        image_data = image_data.split(",")[1]
+                    image_data = strip_data_uri_prefix(block["data"])
 
                     # Get table name and caption
                     table_name = block.get(
@@ -3465,9 +3514,7 @@ def generate_ieee_master_html(form_data):
 
             elif block_type == "image" and block.get("data") and block.get("caption"):
                 img_count += 1
-                image_data = block["data"]
-                if "," in image_data:
-                    image_data = image_data.split(",")[1]
+                image_data = strip_data_uri_prefix(block["data"])
 
                 size_class = f"ieee-image-{block.get('size', 'medium')}"
                 sections_html += f'<div class="ieee-image-container">'
@@ -3786,172 +3833,6 @@ def generate_ieee_master_html(form_data):
 # PDF generation functions removed - using Word→PDF conversion only
 
 
-def pandoc_html_to_docx(html, template_path=None):
-    """Convert master HTML to DOCX using pypandoc with IEEE template"""
-    try:
-        import pypandoc
-
-        # Check if pandoc is available
-        try:
-            pypandoc.get_pandoc_version()
-        except OSError as e:
-            print(
-                f"⚠️ Pandoc binary not available ({e}), using HTML-to-DOCX converter",
-                file=sys.stderr,
-            )
-            return html_to_docx_converter(html)
-
-        # Create temporary HTML file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".html", delete=False, encoding="utf-8"
-        ) as temp_html:
-            temp_html.write(html)
-            temp_html_path = temp_html.name
-
-        # Create temporary DOCX file
-        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as temp_docx:
-            temp_docx_path = temp_docx.name
-
-        try:
-            # Convert HTML to DOCX using pypandoc
-            extra_args = []
-            if template_path and os.path.exists(template_path):
-                extra_args.extend(["--reference-doc", template_path])
-
-            # Add additional pandoc options for better formatting
-            extra_args.extend(["--standalone", "--wrap=none", "--columns=72"])
-
-            pypandoc.convert_file(
-                temp_html_path, "docx", outputfile=temp_docx_path, extra_args=extra_args
-            )
-
-            # Read the generated DOCX
-            with open(temp_docx_path, "rb") as f:
-                docx_bytes = f.read()
-
-            print(
-                "✅ DOCX generated with pypandoc - HTML structure preserved",
-                file=sys.stderr,
-            )
-            return docx_bytes
-
-        finally:
-            # Clean up temporary files
-            try:
-                os.unlink(temp_html_path)
-                os.unlink(temp_docx_path)
-            except:
-                pass
-
-    except ImportError:
-        print("⚠️ pypandoc not available, using HTML-to-DOCX converter", file=sys.stderr)
-        return html_to_docx_converter(html)
-    except Exception as e:
-        print(
-            f"⚠️ pypandoc conversion failed ({e}), using HTML-to-DOCX converter",
-            file=sys.stderr,
-        )
-        return html_to_docx_converter(html)
-
-
-def html_to_docx_converter(html):
-    """Convert HTML to DOCX using python-docx and BeautifulSoup - no external dependencies"""
-    try:
-        import re
-
-        from bs4 import BeautifulSoup
-        from docx import Document
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.shared import Inches, Pt
-
-        print(
-            "🔄 Converting HTML to DOCX using python-docx converter...", file=sys.stderr
-        )
-
-        # Parse HTML
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Create new document
-        doc = Document()
-
-        # Set document margins (IEEE standard)
-        for section in doc.sections:
-            section.left_margin = Inches(0.75)
-            section.right_margin = Inches(0.75)
-            section.top_margin = Inches(0.75)
-            section.bottom_margin = Inches(0.75)
-
-        # Process HTML elements
-        def process_element(element, parent_doc):
-            if element.name == "h1":
-                # Title
-                para = parent_doc.add_heading(element.get_text().strip(), level=0)
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                if para.runs:
-                    para.runs[0].font.name = "Times New Roman"
-                    para.runs[0].font.size = Pt(24)
-                    para.runs[0].bold = True
-
-            elif element.name == "h2":
-                # Section heading
-                para = parent_doc.add_heading(element.get_text().strip(), level=1)
-                if para.runs:
-                    para.runs[0].font.name = "Times New Roman"
-                    para.runs[0].font.size = Pt(10)
-                    para.runs[0].bold = True
-
-            elif element.name == "p":
-                # Paragraph
-                text = element.get_text().strip()
-                if text:
-                    para = parent_doc.add_paragraph(text)
-                    if para.runs:
-                        para.runs[0].font.name = "Times New Roman"
-                        para.runs[0].font.size = Pt(10)
-
-                    # Check for special classes
-                    if "ieee-abstract" in element.get("class", []):
-                        if para.runs:
-                            para.runs[0].font.size = Pt(9)
-                            para.runs[0].bold = True
-                    elif "ieee-keywords" in element.get("class", []):
-                        if para.runs:
-                            para.runs[0].font.size = Pt(9)
-                            para.runs[0].bold = True
-                    elif "ieee-reference" in element.get("class", []):
-                        if para.runs:
-                            para.runs[0].font.size = Pt(9)
-
-            elif element.name == "div":
-                # Process div contents
-                for child in element.children:
-                    if hasattr(child, "name"):
-                        process_element(child, parent_doc)
-
-        # Process body content
-        body = soup.find("body")
-        if body:
-            for child in body.children:
-                if hasattr(child, "name"):
-                    process_element(child, doc)
-
-        # Generate DOCX bytes
-        buffer = BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
-        docx_bytes = buffer.getvalue()
-
-        print(
-            f"✅ HTML-to-DOCX conversion completed: {len(docx_bytes)} bytes",
-            file=sys.stderr,
-        )
-        return docx_bytes
-
-    except Exception as e:
-        print(f"❌ HTML-to-DOCX converter failed: {e}", file=sys.stderr)
-        return None
-
-
 # ============================================================================
 # ALL PDF GENERATION FUNCTIONS REMOVED - USING WORD→PDF CONVERSION ONLY
 # ============================================================================
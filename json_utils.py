@@ -0,0 +1,27 @@
+"""
+JSON utilities for Format-A Python Backend
+Uses orjson when it is installed and falls back to the standard json module
+"""
+
+import json
+
+# orjson parses large request bodies (embedded base64 images) and serializes
+# responses carrying base64 file data much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize a response body to UTF-8 JSON bytes"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def loads_json(data: bytes):
+    """Parse a UTF-8 JSON request or response body"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
@@ -3,11 +3,17 @@ LaTeX to Word Equation Converter
 Converts LaTeX equations to Word OMML (Office Math Markup Language) format
 """
 
-from latex2mathml.converter import convert as latex_to_mathml
+import importlib.util
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 import re
 
+# latex2mathml pulls in email and urllib machinery at import (~40 ms), so it is
+# only imported once an equation is converted. A missing install is still
+# reported when this module is imported.
+if importlib.util.find_spec("latex2mathml") is None:
+    raise ImportError("No module named 'latex2mathml'")
+
 
 def mathml_to_omml(mathml_str):
     """
@@ -64,6 +70,7 @@ def insert_latex_equation(paragraph, latex_code, equation_number=None):
     """
     try:
         # Convert LaTeX to MathML
+        from latex2mathml.converter import convert as latex_to_mathml
         mathml = latex_to_mathml(latex_code)
         
         # For now, we'll insert the equation as formatted text
@@ -98,70 +105,82 @@ def insert_latex_equation(paragraph, latex_code, equation_number=None):
         return False
 
 
+# Common LaTeX to Unicode mappings
+LATEX_UNICODE_REPLACEMENTS = {
+    r'\alpha': 'α',
+    r'\beta': 'β',
+    r'\gamma': 'γ',
+    r'\delta': 'δ',
+    r'\epsilon': 'ε',
+    r'\theta': 'θ',
+    r'\lambda': 'λ',
+    r'\mu': 'μ',
+    r'\pi': 'π',
+    r'\sigma': 'σ',
+    r'\phi': 'φ',
+    r'\omega': 'ω',
+    r'\Delta': 'Δ',
+    r'\Sigma': 'Σ',
+    r'\Omega': 'Ω',
+    r'\infty': '∞',
+    r'\pm': '±',
+    r'\times': '×',
+    r'\div': '÷',
+    r'\leq': '≤',
+    r'\geq': '≥',
+    r'\neq': '≠',
+    r'\approx': '≈',
+    r'\equiv': '≡',
+    r'\sum': '∑',
+    r'\int': '∫',
+    r'\partial': '∂',
+    r'\nabla': '∇',
+    r'\sqrt': '√',
+}
+
+# All commands matched in a single scan, longest first
+LATEX_UNICODE_RE = re.compile('|'.join(
+    re.escape(latex) for latex in sorted(LATEX_UNICODE_REPLACEMENTS, key=len, reverse=True)
+))
+
+SUPERSCRIPTS = {'0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴',
+                '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
+                'n': 'ⁿ', 'i': 'ⁱ'}
+SUBSCRIPTS = {'0': '₀', '1': '₁', '2': '₂', '3': '₃', '4': '₄',
+              '5': '₅', '6': '₆', '7': '₇', '8': '₈', '9': '₉',
+              'i': 'ᵢ', 'j': 'ⱼ', 'n': 'ₙ'}
+
+FRACTION_RE = re.compile(r'\\frac\{([^}]+)\}\{([^}]+)\}')
+BRACED_SUPERSCRIPT_RE = re.compile(r'\^{([0-9ni])}')
+SUPERSCRIPT_RE = re.compile(r'\^([0-9ni])')
+BRACED_SUBSCRIPT_RE = re.compile(r'_{([0-9ijn])}')
+SUBSCRIPT_RE = re.compile(r'_([0-9ijn])')
+COMMAND_RE = re.compile(r'\\([a-zA-Z]+)')
+
+
 def format_latex_for_display(latex_code):
     """
     Format LaTeX code for better display in Word
     Converts common LaTeX commands to Unicode equivalents
     """
-    # Common LaTeX to Unicode mappings
-    replacements = {
-        r'\alpha': 'α',
-        r'\beta': 'β',
-        r'\gamma': 'γ',
-        r'\delta': 'δ',
-        r'\epsilon': 'ε',
-        r'\theta': 'θ',
-        r'\lambda': 'λ',
-        r'\mu': 'μ',
-        r'\pi': 'π',
-        r'\sigma': 'σ',
-        r'\phi': 'φ',
-        r'\omega': 'ω',
-        r'\Delta': 'Δ',
-        r'\Sigma': 'Σ',
-        r'\Omega': 'Ω',
-        r'\infty': '∞',
-        r'\pm': '±',
-        r'\times': '×',
-        r'\div': '÷',
-        r'\leq': '≤',
-        r'\geq': '≥',
-        r'\neq': '≠',
-        r'\approx': '≈',
-        r'\equiv': '≡',
-        r'\sum': '∑',
-        r'\int': '∫',
-        r'\partial': '∂',
-        r'\nabla': '∇',
-        r'\sqrt': '√',
-    }
-    
-    result = latex_code
-    for latex, unicode_char in replacements.items():
-        result = result.replace(latex, unicode_char)
+    result = LATEX_UNICODE_RE.sub(lambda m: LATEX_UNICODE_REPLACEMENTS[m.group(0)], latex_code)
     
     # Handle fractions: \frac{a}{b} -> a/b
-    result = re.sub(r'\\frac\{([^}]+)\}\{([^}]+)\}', r'(\1)/(\2)', result)
+    result = FRACTION_RE.sub(r'(\1)/(\2)', result)
     
     # Handle superscripts: x^{2} -> x²
-    superscripts = {'0': '⁰', '1': '¹', '2': '²', '3': '³', '4': '⁴', 
-                   '5': '⁵', '6': '⁶', '7': '⁷', '8': '⁸', '9': '⁹',
-                   'n': 'ⁿ', 'i': 'ⁱ'}
-    result = re.sub(r'\^{([0-9ni])}', lambda m: superscripts.get(m.group(1), '^' + m.group(1)), result)
-    result = re.sub(r'\^([0-9ni])', lambda m: superscripts.get(m.group(1), '^' + m.group(1)), result)
+    result = BRACED_SUPERSCRIPT_RE.sub(lambda m: SUPERSCRIPTS.get(m.group(1), '^' + m.group(1)), result)
+    result = SUPERSCRIPT_RE.sub(lambda m: SUPERSCRIPTS.get(m.group(1), '^' + m.group(1)), result)
     
     # Handle subscripts: x_{i} -> xᵢ
-    subscripts = {'0': '₀', '1': '₁', '2': '₂', '3': '₃', '4': '₄',
-                 '5': '₅', '6': '₆', '7': '₇', '8': '₈', '9': '₉',
-                 'i': 'ᵢ', 'j': 'ⱼ', 'n': 'ₙ'}
-    result = re.sub(r'_{([0-9ijn])}', lambda m: subscripts.get(m.group(1), '_' + m.group(1)), result)
-    result = re.sub(r'_([0-9ijn])', lambda m: subscripts.get(m.group(1), '_' + m.group(1)), result)
+    result = BRACED_SUBSCRIPT_RE.sub(lambda m: SUBSCRIPTS.get(m.group(1), '_' + m.group(1)), result)
+    result = SUBSCRIPT_RE.sub(lambda m: SUBSCRIPTS.get(m.group(1), '_' + m.group(1)), result)
     
     # Remove remaining braces
     result = result.replace('{', '').replace('}', '')
     
     # Remove backslashes from remaining commands
-    result = re.sub(r'\\([a-zA-Z]+)', r'\1', result)
+    result = COMMAND_RE.sub(r'\1', result)
     
     return result
 
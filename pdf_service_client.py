@@ -11,20 +11,44 @@ Version: 1.1 - Updated endpoint to /convert-pdf
 
 import os
 import base64
+import socket
+import threading
 import time
 import logging
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, asdict
+from urllib.parse import urlsplit
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
+from json_utils import dumps_json, loads_json
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that enables TCP keepalive on pooled connections.
+    
+    urllib3 already sets TCP_NODELAY on every socket; SO_KEEPALIVE is added so
+    a connection left idle between warm invocations is detected as dead by the
+    kernel instead of failing the next request.
+    """
+    
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
 @dataclass
 class PDFConversionRequest:
     """Request model for PDF conversion"""
@@ -89,6 +113,23 @@ class PDFServiceClient:
     - Comprehensive error handling and logging
     """
     
+    # Seconds an is_service_available() result stays valid
+    AVAILABILITY_CACHE_TTL = 5.0
+    # Connect timeout in seconds for the TCP reachability probe
+    TCP_PROBE_TIMEOUT = 2.0
+    # Connect timeout in seconds for HTTP requests; the configured timeout only bounds reads
+    CONNECT_TIMEOUT = 3.05
+    # Read timeout in seconds for health checks
+    HEALTH_READ_TIMEOUT = 10
+    # Error codes the session's Retry adapter has already retried at the transport level
+    ADAPTER_RETRIED_ERRORS = frozenset({"CONNECTION_ERROR", "TIMEOUT"})
+    # Largest conversion response body accepted, enforced while the body is read
+    MAX_RESPONSE_BYTES = 50 * 1024 * 1024
+    # Chunk size in bytes for reading streamed conversion responses
+    RESPONSE_CHUNK_BYTES = 64 * 1024
+    # Bytes of an error response body included in error messages
+    ERROR_SNIPPET_BYTES = 500
+    
     def __init__(
         self,
         service_url: Optional[str] = None,
@@ -101,7 +142,7 @@ class PDFServiceClient:
         
         Args:
             service_url: URL of the PDF service (defaults to PDF_SERVICE_URL env var)
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds for conversion requests
             max_retries: Maximum number of retry attempts
             backoff_factor: Backoff factor for exponential retry delay
         """
@@ -113,6 +154,9 @@ class PDFServiceClient:
         # Remove trailing slash from service URL
         self.service_url = self.service_url.rstrip('/')
         
+        # Cached availability result as (is_available, expires_at) on the monotonic clock
+        self._availability_cache = None
+        
         # Create session with retry logic
         self.session = self._create_session_with_retries()
         
@@ -134,12 +178,12 @@ class PDFServiceClient:
             total=self.max_retries,
             backoff_factor=self.backoff_factor,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"],
+            allowed_methods=frozenset(["GET", "POST"]),
             raise_on_status=False
         )
         
         # Mount adapter with retry strategy
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = KeepAliveHTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -160,7 +204,8 @@ class PDFServiceClient:
             
             response = self.session.get(
                 f"{self.service_url}/health",
-                timeout=10  # Shorter timeout for health checks
+                timeout=(self.CONNECT_TIMEOUT, self.HEALTH_READ_TIMEOUT),  # Shorter timeout for health checks
+                stream=True
             )
             
             if response.status_code == 200:
@@ -168,6 +213,8 @@ class PDFServiceClient:
                 logger.info(f"PDF service is healthy: {health_data}")
                 return health_data
             else:
+                # The body of a failed health check is never used, so don't download it
+                response.close()
                 error_msg = f"Health check failed with status {response.status_code}"
                 logger.error(error_msg)
                 raise PDFServiceError(error_msg, "HEALTH_CHECK_FAILED")
@@ -192,15 +239,165 @@ class PDFServiceClient:
         """
         Check if the PDF service is available.
         
+        The result is cached for AVAILABILITY_CACHE_TTL seconds so repeated
+        polling does not hit the service each time. On a cache miss a plain TCP
+        connect is tried first, and the HTTP health check is only issued when
+        the service port is reachable.
+        
         Returns:
             True if service is available, False otherwise
         """
+        now = time.monotonic()
+        if self._availability_cache and now < self._availability_cache[1]:
+            return self._availability_cache[0]
+        
+        available = self._probe_tcp()
+        if available:
+            try:
+                self.health_check()
+            except PDFServiceError:
+                available = False
+        
+        self._availability_cache = (available, now + self.AVAILABILITY_CACHE_TTL)
+        return available
+    
+    def warm_up(self) -> threading.Thread:
+        """
+        Wake the PDF service in a background thread.
+        
+        Callers that must do local work before converting (such as generating
+        the DOCX) can start this first, so a cold service starts up while that
+        work runs. The thread never touches self.session, which convert_to_pdf
+        may be using at the same time; see _warm_up_probe.
+        
+        Returns:
+            The started daemon thread
+        """
+        thread = threading.Thread(target=self._warm_up_probe, name="pdf-service-warm-up", daemon=True)
+        thread.start()
+        return thread
+    
+    def _warm_up_probe(self) -> None:
+        """
+        Send one GET /health on a short-lived session of its own.
+        
+        Nothing waits for the result; it only refreshes the availability cache.
+        The probe is skipped while a cached result is still valid, so repeated
+        conversions do not add requests to a rate-limited service.
+        """
+        if self._availability_cache and time.monotonic() < self._availability_cache[1]:
+            return
+        
+        session = requests.Session()
         try:
-            self.health_check()
-            return True
-        except PDFServiceError:
+            response = session.get(
+                f"{self.service_url}/health",
+                timeout=(self.CONNECT_TIMEOUT, self.HEALTH_READ_TIMEOUT),
+                stream=True
+            )
+            response.close()
+            available = response.status_code == 200
+        except requests.RequestException as e:
+            logger.warning(f"PDF service warm-up failed: {e}")
+            available = False
+        finally:
+            session.close()
+        
+        self._availability_cache = (available, time.monotonic() + self.AVAILABILITY_CACHE_TTL)
+    
+    def _probe_tcp(self) -> bool:
+        """
+        Check that the service host accepts TCP connections.
+        
+        Returns:
+            True if a connection could be opened, False otherwise
+        """
+        try:
+            parts = urlsplit(self.service_url)
+            hostname = parts.hostname
+            port = parts.port or (443 if parts.scheme == 'https' else 80)
+        except ValueError as e:
+            logger.warning(f"PDF service URL is invalid ({self.service_url}): {e}")
+            return False
+        
+        if hostname is None:
+            logger.warning(f"PDF service URL has no host: {self.service_url}")
+            return False
+        
+        try:
+            with socket.create_connection((hostname, port), timeout=self.TCP_PROBE_TIMEOUT):
+                return True
+        except (OSError, ValueError) as e:
+            logger.warning(f"PDF service is not reachable at {hostname}:{port}: {e}")
             return False
     
+    def _error_body_snippet(self, response: requests.Response) -> str:
+        """
+        Read at most ERROR_SNIPPET_BYTES of an error response body.
+        
+        Only the leading chunk of the streamed body is read and it is decoded
+        as UTF-8 directly, skipping charset detection over the full body.
+        """
+        snippet = next(response.iter_content(self.ERROR_SNIPPET_BYTES), b'')
+        response.close()
+        return snippet.decode('utf-8', 'replace')
+    
+    def _read_conversion_body(self, response: requests.Response) -> bytes:
+        """
+        Read a streamed conversion response body of at most MAX_RESPONSE_BYTES.
+        
+        The declared Content-Length is checked first, then the running total is
+        checked chunk by chunk, so chunked responses or ones without a length
+        header are cut off as soon as they pass the limit.
+        
+        Raises:
+            PDFServiceError: If the body is larger than MAX_RESPONSE_BYTES
+        """
+        content_length = int(response.headers.get('Content-Length') or 0)
+        received = content_length
+        if content_length <= self.MAX_RESPONSE_BYTES:
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(self.RESPONSE_CHUNK_BYTES):
+                received += len(chunk)
+                if received > self.MAX_RESPONSE_BYTES:
+                    break
+                chunks.append(chunk)
+            else:
+                return b''.join(chunks)
+        
+        response.close()
+        error_msg = f"PDF service response too large (over {self.MAX_RESPONSE_BYTES} bytes, got at least {received})"
+        logger.error(error_msg)
+        raise PDFServiceError(error_msg, "RESPONSE_TOO_LARGE")
+    
+    def _build_conversion_body(self, docx_bytes: bytes) -> bytes:
+        """
+        Build the JSON request body for a DOCX payload.
+        
+        Args:
+            docx_bytes: DOCX file content as bytes
+            
+        Returns:
+            UTF-8 encoded JSON request body
+            
+        Raises:
+            PDFServiceError: If the request does not validate
+        """
+        # Encode DOCX data to base64
+        docx_base64 = base64.b64encode(docx_bytes).decode('utf-8')
+        
+        # Create and validate request
+        request = PDFConversionRequest(docx_data=docx_base64)
+        try:
+            request.validate()
+        except ValueError as e:
+            error_msg = f"Unexpected error during conversion: {str(e)}"
+            logger.error(error_msg)
+            raise PDFServiceError(error_msg, "UNKNOWN_ERROR")
+        
+        return dumps_json(request.to_dict())
+    
     def convert_to_pdf(self, docx_bytes: bytes) -> PDFConversionResponse:
         """
         Convert DOCX bytes to PDF using the PDF service.
@@ -214,28 +411,40 @@ class PDFServiceClient:
         Raises:
             PDFServiceError: If conversion fails
         """
-        start_time = time.time()
+        logger.info(f"Converting DOCX to PDF (DOCX size: {len(docx_bytes)} bytes)")
+        return self._send_conversion_request(self._build_conversion_body(docx_bytes))
+    
+    def _send_conversion_request(self, body: bytes) -> PDFConversionResponse:
+        """
+        Send one conversion request and parse the service's response.
         
-        try:
-            # Encode DOCX data to base64
-            docx_base64 = base64.b64encode(docx_bytes).decode('utf-8')
+        Args:
+            body: Request body from _build_conversion_body
             
-            # Create and validate request
-            request = PDFConversionRequest(docx_data=docx_base64)
-            request.validate()
+        Returns:
+            PDFConversionResponse with conversion results
             
-            logger.info(f"Sending PDF conversion request (DOCX size: {len(docx_bytes)} bytes)")
+        Raises:
+            PDFServiceError: If conversion fails
+        """
+        start_time = time.time()
+        
+        try:
+            logger.info(f"Sending PDF conversion request (body size: {len(body)} bytes)")
             
             # Send conversion request to correct endpoint
             response = self.session.post(
                 f"{self.service_url}/convert-pdf",
-                json=request.to_dict(),
-                timeout=self.timeout
+                data=body,
+                headers={'Content-Type': 'application/json'},
+                timeout=(self.CONNECT_TIMEOUT, self.timeout),
+                stream=True
             )
             
             # Handle different response status codes
             if response.status_code == 200:
-                result = response.json()
+                raw = self._read_conversion_body(response)
+                result = loads_json(raw)
                 elapsed_ms = int((time.time() - start_time) * 1000)
                 
                 logger.info(f"PDF conversion successful (took {elapsed_ms}ms)")
@@ -250,24 +459,26 @@ class PDFServiceClient:
                 )
             
             elif response.status_code == 400:
-                error_msg = f"Invalid request: {response.text}"
+                error_msg = f"Invalid request: {self._error_body_snippet(response)}"
                 logger.error(error_msg)
                 raise PDFServiceError(error_msg, "INVALID_REQUEST")
             
             elif response.status_code == 429:
                 retry_after = int(response.headers.get('Retry-After', 30))
+                response.close()
                 error_msg = "Rate limit exceeded"
                 logger.warning(f"{error_msg}, retry after {retry_after}s")
                 raise PDFServiceError(error_msg, "RATE_LIMITED", retry_after)
             
             elif response.status_code == 503:
                 retry_after = int(response.headers.get('Retry-After', 60))
+                response.close()
                 error_msg = "Service temporarily unavailable"
                 logger.warning(f"{error_msg}, retry after {retry_after}s")
                 raise PDFServiceError(error_msg, "SERVICE_UNAVAILABLE", retry_after)
             
             else:
-                error_msg = f"Conversion failed with status {response.status_code}: {response.text}"
+                error_msg = f"Conversion failed with status {response.status_code}: {self._error_body_snippet(response)}"
                 logger.error(error_msg)
                 raise PDFServiceError(error_msg, "CONVERSION_FAILED")
                 
@@ -300,6 +511,8 @@ class PDFServiceClient:
         
         This method adds an additional retry layer on top of the session's
         automatic retries for handling specific scenarios like rate limiting.
+        Connection errors and timeouts are not retried again here since the
+        session's Retry adapter has already retried them.
         
         Args:
             docx_bytes: DOCX file content as bytes
@@ -314,10 +527,13 @@ class PDFServiceClient:
         max_attempts = max_attempts or self.max_retries
         last_error = None
         
+        # Encode the document once; every attempt sends the same body
+        body = self._build_conversion_body(docx_bytes)
+        
         for attempt in range(1, max_attempts + 1):
             try:
                 logger.info(f"PDF conversion attempt {attempt}/{max_attempts}")
-                return self.convert_to_pdf(docx_bytes)
+                return self._send_conversion_request(body)
             
             except PDFServiceError as e:
                 last_error = e
@@ -327,6 +543,11 @@ class PDFServiceClient:
                     logger.error(f"Non-retryable error: {e.message}")
                     raise
                 
+                # Connection failures and timeouts were already retried by the adapter
+                if e.error_code in self.ADAPTER_RETRIED_ERRORS:
+                    logger.error(f"Transport retries exhausted: {e.message}")
+                    raise
+                
                 # Check if we should retry
                 if attempt < max_attempts:
                     # Calculate delay with exponential backoff
@@ -361,3 +582,74 @@ def create_pdf_service_client() -> PDFServiceClient:
     """
     timeout = int(os.environ.get('PDF_SERVICE_TIMEOUT', '30'))
     return PDFServiceClient(timeout=timeout)
+
+
+def benchmark_health(client: PDFServiceClient, repeat: int = 1, parallel: int = 1) -> Dict[str, Any]:
+    """
+    Fire repeat x parallel health requests at the client's service.
+    
+    The requests share one benchmark session sized for the parallel workers,
+    so the client's own session and adapters are left untouched.
+    
+    Args:
+        client: PDF service client whose service URL and timeouts are used
+        repeat: Number of rounds of requests
+        parallel: Number of concurrent requests per round
+        
+    Returns:
+        Dictionary with request count, error count and p50/p95/p99 latency in ms
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    import statistics
+    
+    # Size the connection pool so parallel workers keep their connections alive
+    session = requests.Session()
+    adapter = KeepAliveHTTPAdapter(pool_maxsize=parallel, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    def probe(_):
+        t0 = time.monotonic_ns()
+        try:
+            ok = session.get(
+                f"{client.service_url}/health",
+                timeout=(client.CONNECT_TIMEOUT, client.HEALTH_READ_TIMEOUT)
+            ).status_code == 200
+        except requests.RequestException:
+            ok = False
+        return (time.monotonic_ns() - t0) / 1e6, ok
+    
+    try:
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            results = list(executor.map(probe, range(repeat * parallel)))
+    finally:
+        session.close()
+    
+    samples = [ms for ms, _ in results]
+    if len(samples) > 1:
+        cuts = statistics.quantiles(samples, n=100, method='inclusive')
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = samples[0]
+    
+    return {
+        'n': len(samples),
+        'errors': sum(1 for _, ok in results if not ok),
+        'p50': p50,
+        'p95': p95,
+        'p99': p99,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Measure PDF service health endpoint latency")
+    parser.add_argument('--repeat', type=int, default=1, help="Number of request rounds")
+    parser.add_argument('--parallel', type=int, default=1, help="Concurrent requests per round")
+    args = parser.parse_args()
+    
+    logging.getLogger().setLevel(logging.WARNING)
+    stats = benchmark_health(create_pdf_service_client(), max(args.repeat, 1), max(args.parallel, 1))
+    print(f"health: n={stats['n']} errors={stats['errors']} "
+          f"p50={stats['p50']:.0f}ms p95={stats['p95']:.0f}ms p99={stats['p99']:.0f}ms")
@@ -0,0 +1,85 @@
+"""
+Tests for JWT validation in auth_utils
+
+This test file verifies that memoized token decodes still honour expiry,
+secret rotation and caller mutation of the returned payload.
+"""
+
+import time
+import jwt
+import pytest
+from unittest.mock import patch
+import auth_utils
+from auth_utils import validate_jwt_token
+
+SECRET = 'test-secret-at-least-32-bytes-long'
+
+
+def make_token(secret=SECRET, expires_in=60):
+    """Sign a token carrying the fields validate_jwt_token requires"""
+    payload = {
+        'userId': 'user-1',
+        'email': 'user@test.com',
+        'name': 'Test User',
+        'exp': int(time.time()) + expires_in,
+    }
+    return jwt.encode(payload, secret, algorithm='HS256')
+
+
+@pytest.fixture(autouse=True)
+def jwt_secret(monkeypatch):
+    """Use a known secret and start every test with an empty decode cache"""
+    monkeypatch.setenv('JWT_SECRET', SECRET)
+    auth_utils._decode_jwt_token.cache_clear()
+    yield
+    auth_utils._decode_jwt_token.cache_clear()
+
+
+class TestValidateJwtToken:
+    """Test validate_jwt_token on top of the decode cache"""
+
+    def test_valid_token_with_bearer_prefix(self):
+        """Test a valid token is decoded, with or without the Bearer prefix"""
+        token = make_token()
+
+        assert validate_jwt_token(f'Bearer {token}')['userId'] == 'user-1'
+        assert validate_jwt_token(token)['userId'] == 'user-1'
+        assert auth_utils._decode_jwt_token.cache_info().hits == 1
+
+    def test_expired_after_cache_hit(self):
+        """Test a cached token is rejected once its exp has passed"""
+        token = make_token(expires_in=10)
+        assert validate_jwt_token(token) is not None
+
+        with patch('auth_utils.time.time', return_value=time.time() + 20):
+            assert validate_jwt_token(token) is None
+
+        assert auth_utils._decode_jwt_token.cache_info().hits == 1
+
+    def test_rotated_secret_misses_cache(self, monkeypatch):
+        """Test a token cached under the old secret is rejected after rotation"""
+        token = make_token()
+        assert validate_jwt_token(token) is not None
+
+        monkeypatch.setenv('JWT_SECRET', 'rotated-secret-at-least-32-bytes-long')
+
+        assert validate_jwt_token(token) is None
+        assert auth_utils._decode_jwt_token.cache_info().hits == 0
+
+    def test_mutating_result_does_not_poison_cache(self):
+        """Test changes to a returned payload are not seen by later validations"""
+        token = make_token()
+        first = validate_jwt_token(token)
+        first['userId'] = 'someone-else'
+        del first['email']
+
+        second = validate_jwt_token(token)
+
+        assert second['userId'] == 'user-1'
+        assert second['email'] == 'user@test.com'
+        assert auth_utils._decode_jwt_token.cache_info().hits == 1
+
+    def test_invalid_token_is_not_cached(self):
+        """Test failed decodes are never memoized"""
+        assert validate_jwt_token('not-a-token') is None
+        assert auth_utils._decode_jwt_token.cache_info().currsize == 0
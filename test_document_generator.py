@@ -0,0 +1,54 @@
+"""
+Tests for the document generator endpoint helpers
+
+This test file verifies that the PDF size reported to the frontend matches
+the decoded size of the PDF service's base64 data.
+"""
+
+import base64
+import importlib.util
+import os
+import pytest
+
+# The endpoint module name has a hyphen, so it is loaded from its path
+_spec = importlib.util.spec_from_file_location(
+    'document_generator',
+    os.path.join(os.path.dirname(__file__), 'api', 'document-generator.py')
+)
+document_generator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(document_generator)
+base64_decoded_size = document_generator.base64_decoded_size
+
+
+def _wrap(text, width=76):
+    """Split base64 text into MIME-style lines"""
+    return '\n'.join(text[i:i + width] for i in range(0, len(text), width))
+
+
+class TestBase64DecodedSize:
+    """Test base64_decoded_size against real decoding"""
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 5, 100, 1001])
+    def test_padded(self, size):
+        """Test padded base64 of every remainder length"""
+        data = base64.b64encode(os.urandom(size)).decode('ascii')
+        assert base64_decoded_size(data) == size
+
+    @pytest.mark.parametrize("size", [1, 2, 4, 5, 1001])
+    def test_unpadded(self, size):
+        """Test base64 with the trailing padding removed"""
+        data = base64.b64encode(os.urandom(size)).decode('ascii').rstrip('=')
+        assert base64_decoded_size(data) == size
+
+    @pytest.mark.parametrize("newline", ['\n', '\r\n'])
+    def test_line_wrapped(self, newline):
+        """Test line breaks and surrounding whitespace are not counted"""
+        data = base64.b64encode(os.urandom(1000)).decode('ascii')
+        wrapped = ' ' + _wrap(data).replace('\n', newline) + newline
+        assert base64_decoded_size(wrapped) == 1000
+
+    @pytest.mark.parametrize("data", ['not base64!', 'QQ==QQ==', 'Q===', 'QUJDR'])
+    def test_invalid(self, data):
+        """Test data that is not base64 is rejected instead of sized"""
+        with pytest.raises(ValueError):
+            base64_decoded_size(data)
@@ -0,0 +1,223 @@
+"""
+Tests for the health check endpoint and its helpers
+
+This test file verifies that .env files are parsed the way they are commonly
+written, that a failed load is retried, that cached database probes are
+reported as cached, and how the handler answers HEAD and multi requests.
+"""
+
+import os
+import json
+import pytest
+from io import BytesIO
+from unittest.mock import Mock
+from api import health
+from api.health import _ENV_LINE_RE
+
+
+class FakeSocket:
+    """Connection stand-in that feeds a raw HTTP request to the handler and collects its reply"""
+
+    def __init__(self, raw_request):
+        self._rfile = BytesIO(raw_request)
+        self.sent = bytearray()
+
+    def makefile(self, mode, *args, **kwargs):
+        return self._rfile
+
+    def sendall(self, data):
+        self.sent += data
+
+
+def call_handler(method, body=None, headers=None):
+    """Run one request through the health handler; returns (status, headers, body)"""
+    headers = dict(headers or {})
+    payload = b''
+    if body is not None:
+        payload = json.dumps(body).encode('utf-8')
+        headers['Content-Length'] = str(len(payload))
+    head = ''.join(f'{name}: {value}\r\n' for name, value in headers.items())
+    raw_request = f'{method} /api/health HTTP/1.1\r\nHost: test\r\n{head}\r\n'.encode() + payload
+
+    sock = FakeSocket(raw_request)
+    health.handler(sock, ('127.0.0.1', 0), Mock())
+
+    head, _, response_body = bytes(sock.sent).partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    response_headers = dict(line.split(': ', 1) for line in header_lines)
+    return int(status_line.split()[1]), response_headers, response_body
+
+
+class TestEnvLineParsing:
+    """Test the .env line pattern used by load_env"""
+
+    @pytest.mark.parametrize("line, expected", [
+        ('KEY=value', [('KEY', 'value')]),
+        ('KEY = value', [('KEY', 'value')]),
+        ('  KEY\t=\tvalue  ', [('KEY', 'value')]),
+        ('export KEY=value', [('KEY', 'value')]),
+        ('export KEY = value\r', [('KEY', 'value')]),
+        ('export=1', [('export', '1')]),
+        ('URL=postgres://u:p@h/db?a=b', [('URL', 'postgres://u:p@h/db?a=b')]),
+        ('EMPTY=', [('EMPTY', '')]),
+        ('# KEY=value', []),
+        ('', []),
+    ])
+    def test_line_forms(self, line, expected):
+        """Test spaced, exported and plain assignments parse to the same pair"""
+        assert _ENV_LINE_RE.findall(line) == expected
+
+    def test_multiple_lines(self):
+        """Test every assignment in a file is found and other lines are skipped"""
+        text = "# settings\nA=1\n\nexport B = 2\nnot an assignment\n"
+        assert dict(_ENV_LINE_RE.findall(text)) == {'A': '1', 'B': '2'}
+
+
+class TestLoadEnv:
+    """Test load_env only runs once per successful read"""
+
+    def test_failed_read_is_retried(self, tmp_path, monkeypatch):
+        """Test a read error leaves the environment unloaded for the next call"""
+        monkeypatch.setattr(health, 'PARENT_DIR', str(tmp_path))
+        monkeypatch.setattr(health, '_ENV_LOADED', False)
+        monkeypatch.setenv('HEALTH_TEST_KEY', 'unset')
+        env_path = tmp_path / '.env.local'
+        env_path.mkdir()
+
+        with pytest.raises(OSError):
+            health.load_env()
+        assert health._ENV_LOADED is False
+
+        env_path.rmdir()
+        env_path.write_text('HEALTH_TEST_KEY=loaded\n')
+        health.load_env()
+        assert health._ENV_LOADED is True
+        assert os.environ['HEALTH_TEST_KEY'] == 'loaded'
+
+
+class TestDatabaseProbeCache:
+    """Test reuse of successful database probes"""
+
+    def test_cached_result_is_marked_with_age(self, monkeypatch):
+        """Test a reused probe result says it is cached and how old it is"""
+        probe_result = {'success': True, 'timestamp': '2026-01-01T00:00:00'}
+        mock_test_connection = Mock(return_value=probe_result)
+        mock_monotonic = Mock(side_effect=[100.0, 112.34])
+        monkeypatch.setattr(health, 'test_connection', mock_test_connection)
+        monkeypatch.setattr(health, '_db_probe_cache', {})
+        monkeypatch.setattr(health.time, 'monotonic', mock_monotonic)
+        check = health.handler.__new__(health.handler)
+
+        fresh = check._test_database_with_timeout()
+        cached = check._test_database_with_timeout()
+
+        assert fresh == probe_result
+        assert 'cached' not in fresh
+        assert cached == {**probe_result, 'cached': True, 'cacheAgeSeconds': 12.3}
+        mock_test_connection.assert_called_once_with(
+            connect_timeout=health.DB_HEALTH_CONNECT_TIMEOUT
+        )
+
+    def test_expired_result_is_probed_again(self, monkeypatch):
+        """Test a probe older than the TTL is not reused"""
+        mock_test_connection = Mock(return_value={'success': True})
+        mock_monotonic = Mock(side_effect=[100.0, 100.0 + health.DB_PROBE_CACHE_TTL, 131.0])
+        monkeypatch.setattr(health, 'test_connection', mock_test_connection)
+        monkeypatch.setattr(health, '_db_probe_cache', {})
+        monkeypatch.setattr(health.time, 'monotonic', mock_monotonic)
+        check = health.handler.__new__(health.handler)
+
+        check._test_database_with_timeout()
+        result = check._test_database_with_timeout()
+
+        assert result == {'success': True}
+        assert mock_test_connection.call_count == 2
+
+
+class TestHeadRequest:
+    """Test HEAD as a cheap liveness probe"""
+
+    def test_head_returns_headers_only(self, monkeypatch):
+        """Test HEAD answers 200 with CORS headers and no body, without probing the database"""
+        mock_test_connection = Mock()
+        monkeypatch.setattr(health, 'test_connection', mock_test_connection)
+        monkeypatch.delenv('NODE_ENV', raising=False)
+
+        status, headers, body = call_handler('HEAD', headers={'Origin': 'http://localhost:5173'})
+
+        assert status == 200
+        assert headers['Content-Type'] == 'application/json'
+        assert headers['Access-Control-Allow-Origin'] == 'http://localhost:5173'
+        assert 'POST' in headers['Access-Control-Allow-Methods']
+        assert body == b''
+        mock_test_connection.assert_not_called()
+
+
+class TestMultiRequest:
+    """Test the 'multi' POST action end to end through the handler"""
+
+    @pytest.fixture(autouse=True)
+    def database(self, monkeypatch):
+        """Stub the database probe and connection cleanup"""
+        self.cleanup = Mock()
+        monkeypatch.setattr(health, 'test_connection', Mock(return_value={'success': True}))
+        monkeypatch.setattr(health, 'cleanup_connection', self.cleanup)
+        monkeypatch.setattr(health, '_db_probe_cache', {})
+
+    def test_mixed_batch(self):
+        """Test health, validate_file and performance results come back in request order"""
+        status, _, body = call_handler('POST', {'action': 'multi', 'requests': [
+            {'action': 'health'},
+            {'action': 'validate_file', 'file_data': 'aGVsbG8=', 'file_type': 'text'},
+            {'action': 'performance'},
+        ]})
+
+        data = json.loads(body)['data']
+        assert status == 200
+        assert data['count'] == 3
+        assert [r['action'] for r in data['results']] == ['health', 'validate_file', 'performance']
+        assert all(r['success'] for r in data['results'])
+        assert data['results'][0]['data']['database'] == {'success': True}
+        assert data['results'][1]['data']['valid'] is True
+        assert 'vercel_limits' in data['results'][2]['data']
+        self.cleanup.assert_called_once_with()
+
+    def test_unknown_sub_action(self):
+        """Test an unsupported sub-action fails on its own without failing the batch"""
+        status, _, body = call_handler('POST', {'action': 'multi', 'requests': [
+            {'action': 'batch_process'},
+            'not an object',
+            {'action': 'performance'},
+        ]})
+
+        results = json.loads(body)['data']['results']
+        assert status == 200
+        assert results[0] == {
+            'action': 'batch_process',
+            'success': False,
+            'error': "Action 'batch_process' not supported in multi requests"
+        }
+        assert results[1]['action'] is None and results[1]['success'] is False
+        assert results[2]['success'] is True
+
+    def test_batch_over_limit(self):
+        """Test more than ten sub-requests are rejected before any of them run"""
+        status, _, body = call_handler('POST', {
+            'action': 'multi',
+            'requests': [{'action': 'performance'}] * 11
+        })
+
+        error = json.loads(body)['error']
+        assert status == 500
+        assert error['details'] == 'Batch size 11 exceeds maximum 10'
+        self.cleanup.assert_not_called()
+
+    @pytest.mark.parametrize("sub_requests", ['health', {'action': 'health'}, 3])
+    def test_non_list_requests(self, sub_requests):
+        """Test a requests value that is not a list is rejected"""
+        status, _, body = call_handler('POST', {'action': 'multi', 'requests': sub_requests})
+
+        error = json.loads(body)['error']
+        assert status == 500
+        assert error['details'] == "requests must be a list of {'action': ...} objects"
+        self.cleanup.assert_not_called()
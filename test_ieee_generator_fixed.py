@@ -0,0 +1,116 @@
+"""
+Tests for the IEEE generator text helpers
+
+This test file verifies that sanitize_text strips markup without losing the
+surrounding text, that embedded images are decoded once per document, and
+that save_docx_bytes writes the same package as Document.save.
+"""
+
+import base64
+import pytest
+from io import BytesIO
+from unittest.mock import patch
+from zipfile import ZIP_STORED, ZipFile
+from docx import Document
+import ieee_generator_fixed
+from ieee_generator_fixed import generate_ieee_document, sanitize_text, save_docx_bytes
+
+# 1x1 transparent PNG
+PNG_BASE64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+class TestSanitizeText:
+    """Test sanitize_text HTML handling"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ('<div>First</div><p>Second</p>', 'First\nSecond'),
+        ('a<br>b<BR/>c', 'a\nb\nc'),
+        ('<span class="x">bold</span> text', 'bold text'),
+        ('x &lt; y &amp; z', 'x < y & z'),
+    ])
+    def test_tags_and_entities(self, text, expected):
+        """Test line-breaking tags become newlines and other tags are removed"""
+        assert sanitize_text(text) == expected
+
+    @pytest.mark.parametrize("text, expected", [
+        ('p<0.05</p>', 'p<0.05'),
+        ('if x < y<br>then z', 'if x < y\nthen z'),
+    ])
+    def test_literal_less_than_next_to_tag(self, text, expected):
+        """Test a literal "<" in the text does not swallow the following tag"""
+        assert sanitize_text(text) == expected
+
+
+class TestImageDecoding:
+    """Test embedded images are decoded once per document"""
+
+    pytestmark = pytest.mark.slow
+
+    def test_repeated_images_decode_once_per_build(self):
+        """Test the same image in several blocks is decoded once, and again for the next build"""
+        image = f"data:image/png;base64,{PNG_BASE64}"
+        form_data = {
+            'title': 'Image Paper',
+            'sections': [
+                {'title': 'One', 'contentBlocks': [
+                    {'type': 'image', 'data': image, 'caption': 'First'},
+                    {'type': 'image', 'data': image, 'caption': 'Again'},
+                ]},
+                {'title': 'Two', 'contentBlocks': [
+                    {'type': 'text', 'content': 'Text', 'data': image},
+                ]},
+            ],
+        }
+
+        with patch.object(ieee_generator_fixed, 'b64decode', wraps=base64.b64decode) as mock_decode:
+            generate_ieee_document(form_data)
+            assert mock_decode.call_count == 1
+            generate_ieee_document(form_data)
+            assert mock_decode.call_count == 2
+
+
+def _document_with_picture():
+    """Small document with one paragraph and one embedded PNG"""
+    doc = Document()
+    doc.add_paragraph('Body text')
+    doc.add_picture(BytesIO(base64.b64decode(PNG_BASE64)))
+    return doc
+
+
+def _package_parts(docx_bytes):
+    """Map of part name to part bytes for a DOCX package"""
+    with ZipFile(BytesIO(docx_bytes)) as package:
+        return {name: package.read(name) for name in package.namelist()}
+
+
+class TestSaveDocxBytes:
+    """Test save_docx_bytes against python-docx's own Document.save"""
+
+    def _saved_with_document_save(self, doc):
+        buffer = BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+
+    def test_parts_match_document_save(self):
+        """Test every part name and part body matches Document.save"""
+        doc = _document_with_picture()
+
+        expected = _package_parts(self._saved_with_document_save(doc))
+        result = save_docx_bytes(doc)
+
+        assert _package_parts(result) == expected
+        with ZipFile(BytesIO(result)) as package:
+            images = [info for info in package.infolist() if info.filename.endswith('.png')]
+        assert images and all(info.compress_type == ZIP_STORED for info in images)
+
+    def test_falls_back_to_document_save_without_private_api(self):
+        """Test a python-docx without the PackageWriter steps still saves through Document.save"""
+        doc = _document_with_picture()
+        expected = _package_parts(self._saved_with_document_save(doc))
+
+        with patch.object(ieee_generator_fixed, 'PackageWriter', object):
+            result = save_docx_bytes(doc)
+
+        assert _package_parts(result) == expected
@@ -0,0 +1,27 @@
+"""
+Tests for the shared JSON helpers
+
+This test file verifies that dumps_json and loads_json give the same results
+with and without orjson installed.
+"""
+
+import pytest
+from unittest.mock import patch
+import json_utils
+from json_utils import dumps_json, loads_json
+
+PAYLOAD = {'success': True, 'file_data': 'JVBERi0xLjQ=', 'file_size': 8, 'title': 'Café'}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=['orjson', 'stdlib'])
+def test_round_trip(use_orjson):
+    """Test a response body serializes to UTF-8 bytes and parses back unchanged"""
+    if use_orjson and json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+
+    with patch.object(json_utils, 'orjson', json_utils.orjson if use_orjson else None):
+        data = dumps_json(PAYLOAD)
+
+        assert isinstance(data, bytes)
+        assert loads_json(data) == PAYLOAD
+        assert loads_json('{"title": "Café"}'.encode('utf-8')) == {'title': 'Café'}
@@ -6,15 +6,21 @@ including health checks, conversion requests, and retry logic.
 """
 
 import os
+import json
 import base64
+import socket
+import threading
+import time
 import pytest
+import requests
 from unittest.mock import Mock, patch, MagicMock
 from pdf_service_client import (
     PDFServiceClient,
     PDFServiceError,
     PDFConversionRequest,
     PDFConversionResponse,
-    create_pdf_service_client
+    create_pdf_service_client,
+    benchmark_health
 )
 
 
@@ -63,6 +69,15 @@ class TestPDFServiceClient:
             client = PDFServiceClient()
             assert client.service_url == "https://env-service.com"
     
+    def test_session_enables_tcp_keepalive(self):
+        """Test pooled connections keep urllib3's defaults and add SO_KEEPALIVE"""
+        client = PDFServiceClient(service_url="https://test-service.com")
+        adapter = client.session.get_adapter("https://test-service.com")
+        
+        socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    
     def test_trailing_slash_removed(self):
         """Test trailing slash is removed from service URL"""
         client = PDFServiceClient(service_url="https://test-service.com/")
@@ -109,6 +124,7 @@ class TestPDFServiceClient:
             client.health_check()
         
         assert exc_info.value.error_code == "HEALTH_CHECK_FAILED"
+        mock_response.close.assert_called_once()
     
     @patch('pdf_service_client.requests.Session')
     def test_is_service_available(self, mock_session_class):
@@ -123,7 +139,128 @@ class TestPDFServiceClient:
         client = PDFServiceClient()
         client.session = mock_session
         
+        with patch('pdf_service_client.socket.create_connection'):
+            assert client.is_service_available() is True
+    
+    @patch('pdf_service_client.socket.create_connection')
+    @patch('pdf_service_client.requests.Session')
+    def test_is_service_available_cached(self, mock_session_class, mock_connect):
+        """Test repeated availability checks reuse the cached result"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "healthy"}
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        
+        client = PDFServiceClient()
+        client.session = mock_session
+        
+        assert client.is_service_available() is True
         assert client.is_service_available() is True
+        
+        mock_connect.assert_called_once()
+        mock_session.get.assert_called_once()
+    
+    @patch('pdf_service_client.socket.create_connection')
+    @patch('pdf_service_client.requests.Session')
+    def test_is_service_available_unreachable(self, mock_session_class, mock_connect):
+        """Test an unreachable host skips the HTTP health check"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_connect.side_effect = ConnectionRefusedError("Connection refused")
+        
+        client = PDFServiceClient(service_url="http://localhost:5000")
+        client.session = mock_session
+        
+        assert client.is_service_available() is False
+        mock_connect.assert_called_once_with(("localhost", 5000), timeout=client.TCP_PROBE_TIMEOUT)
+        mock_session.get.assert_not_called()
+    
+    @pytest.mark.parametrize("service_url", ["http://host:abc", "not a url"])
+    @patch('pdf_service_client.socket.create_connection')
+    @patch('pdf_service_client.requests.Session')
+    def test_is_service_available_malformed_url(self, mock_session_class, mock_connect, service_url):
+        """Test a malformed service URL reports the service unavailable instead of raising"""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        
+        client = PDFServiceClient(service_url=service_url)
+        client.session = mock_session
+        
+        assert client.is_service_available() is False
+        mock_connect.assert_not_called()
+        mock_session.get.assert_not_called()
+    
+    def test_warm_up_probes_on_its_own_session(self):
+        """Test warm_up sends its health request on a separate session"""
+        client = PDFServiceClient(service_url="https://test-service.com")
+        client.session = Mock()
+        
+        with patch('pdf_service_client.requests.Session') as mock_session_class:
+            warm_session = mock_session_class.return_value
+            warm_session.get.return_value.status_code = 200
+            thread = client.warm_up()
+            thread.join(timeout=1)
+        
+        assert thread.daemon
+        assert not thread.is_alive()
+        warm_session.get.assert_called_once_with(
+            "https://test-service.com/health",
+            timeout=(client.CONNECT_TIMEOUT, client.HEALTH_READ_TIMEOUT),
+            stream=True
+        )
+        warm_session.close.assert_called_once()
+        assert client.session.mock_calls == []
+        assert client._availability_cache[0] is True
+    
+    def test_warm_up_skipped_while_availability_cached(self):
+        """Test warm_up sends nothing while a cached availability result is valid"""
+        client = PDFServiceClient(service_url="https://test-service.com")
+        client._availability_cache = (True, time.monotonic() + 60)
+        
+        with patch('pdf_service_client.requests.Session') as mock_session_class:
+            client.warm_up().join(timeout=1)
+        
+        mock_session_class.assert_not_called()
+    
+    def test_conversion_does_not_wait_for_warm_up(self):
+        """Test convert_to_pdf runs on the client session while the warm-up is still in flight"""
+        client = PDFServiceClient(service_url="https://test-service.com")
+        client.session = Mock()
+        response = client.session.post.return_value
+        response.status_code = 200
+        response.headers = {}
+        response.iter_content.return_value = iter([json.dumps({
+            "success": True,
+            "pdf_data": base64.b64encode(b"PDF content").decode('utf-8')
+        }).encode('utf-8')])
+        
+        release = threading.Event()
+        probe_started = threading.Event()
+        
+        def slow_health(*args, **kwargs):
+            probe_started.set()
+            release.wait(timeout=5)
+            return Mock(status_code=200)
+        
+        with patch('pdf_service_client.requests.Session') as mock_session_class:
+            warm_session = mock_session_class.return_value
+            warm_session.get.side_effect = slow_health
+            thread = client.warm_up()
+            assert probe_started.wait(timeout=1)
+            
+            result = client.convert_to_pdf(b"test content")
+            
+            assert result.success is True
+            assert thread.is_alive()
+            release.set()
+            thread.join(timeout=1)
+        
+        assert not thread.is_alive()
+        assert warm_session is not client.session
+        client.session.get.assert_not_called()
+        client.session.post.assert_called_once()
     
     @patch('pdf_service_client.requests.Session')
     def test_convert_to_pdf_success(self, mock_session_class):
@@ -131,13 +268,14 @@ class TestPDFServiceClient:
         mock_session = Mock()
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = iter([json.dumps({
             "success": True,
             "pdf_data": base64.b64encode(b"PDF content").decode('utf-8'),
             "size": 1024,
             "conversion_method": "docx2pdf_exact",
             "processing_time_ms": 2500
-        }
+        }).encode('utf-8')])
         mock_session.post.return_value = mock_response
         mock_session_class.return_value = mock_session
         
@@ -152,6 +290,51 @@ class TestPDFServiceClient:
         assert result.size == 1024
         assert result.conversion_method == "docx2pdf_exact"
         mock_session.post.assert_called_once()
+        assert mock_session.post.call_args.kwargs['timeout'] == (client.CONNECT_TIMEOUT, client.timeout)
+    
+    @patch('pdf_service_client.requests.Session')
+    def test_convert_to_pdf_response_too_large(self, mock_session_class):
+        """Test a declared oversized response is rejected before the body is read"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Length': str(PDFServiceClient.MAX_RESPONSE_BYTES + 1)}
+        mock_session.post.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        
+        client = PDFServiceClient()
+        client.session = mock_session
+        
+        with pytest.raises(PDFServiceError) as exc_info:
+            client.convert_to_pdf(b"test content")
+        
+        assert exc_info.value.error_code == "RESPONSE_TOO_LARGE"
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()
+    
+    @patch.object(PDFServiceClient, 'MAX_RESPONSE_BYTES', 10)
+    @patch('pdf_service_client.requests.Session')
+    def test_convert_to_pdf_streamed_response_too_large(self, mock_session_class):
+        """Test responses without a Content-Length are cut off once they pass the limit"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        chunks = iter([b"123456", b"789012", b"never read"])
+        mock_response.iter_content.return_value = chunks
+        mock_session.post.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        
+        client = PDFServiceClient()
+        client.session = mock_session
+        
+        with pytest.raises(PDFServiceError) as exc_info:
+            client.convert_to_pdf(b"test content")
+        
+        assert exc_info.value.error_code == "RESPONSE_TOO_LARGE"
+        mock_response.iter_content.assert_called_once_with(client.RESPONSE_CHUNK_BYTES)
+        mock_response.close.assert_called_once()
+        assert next(chunks) == b"never read"
     
     @patch('pdf_service_client.requests.Session')
     def test_convert_to_pdf_rate_limited(self, mock_session_class):
@@ -199,7 +382,7 @@ class TestPDFServiceClient:
         mock_session = Mock()
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.text = "Invalid DOCX data"
+        mock_response.iter_content.return_value = iter([b"Invalid DOCX data"])
         mock_session.post.return_value = mock_response
         mock_session_class.return_value = mock_session
         
@@ -210,6 +393,8 @@ class TestPDFServiceClient:
             client.convert_to_pdf(b"test content")
         
         assert exc_info.value.error_code == "INVALID_REQUEST"
+        assert exc_info.value.message == "Invalid request: Invalid DOCX data"
+        mock_response.iter_content.assert_called_once_with(client.ERROR_SNIPPET_BYTES)
     
     @patch('pdf_service_client.time.sleep')
     @patch('pdf_service_client.requests.Session')
@@ -225,11 +410,12 @@ class TestPDFServiceClient:
         
         mock_response_success = Mock()
         mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {
+        mock_response_success.headers = {}
+        mock_response_success.iter_content.return_value = iter([json.dumps({
             "success": True,
             "pdf_data": base64.b64encode(b"PDF content").decode('utf-8'),
             "size": 1024
-        }
+        }).encode('utf-8')])
         
         mock_session.post.side_effect = [mock_response_fail, mock_response_success]
         mock_session_class.return_value = mock_session
@@ -243,6 +429,30 @@ class TestPDFServiceClient:
         assert mock_session.post.call_count == 2
         mock_sleep.assert_called_once()
     
+    @patch('pdf_service_client.time.sleep')
+    @patch('pdf_service_client.requests.Session')
+    def test_convert_with_retry_reuses_request_body(self, mock_session_class, mock_sleep):
+        """Test retries send the same encoded body without re-serializing"""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.headers = {'Retry-After': '1'}
+        mock_session.post.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        
+        client = PDFServiceClient()
+        client.session = mock_session
+        
+        with patch('pdf_service_client.base64.b64encode', wraps=base64.b64encode) as mock_encode:
+            with pytest.raises(PDFServiceError):
+                client.convert_to_pdf_with_retry(b"test content", max_attempts=3)
+        
+        bodies = [call.kwargs['data'] for call in mock_session.post.call_args_list]
+        assert len(bodies) == 3
+        assert bodies[0] is bodies[1] is bodies[2]
+        assert json.loads(bodies[0])['docx_data'] == base64.b64encode(b"test content").decode('utf-8')
+        mock_encode.assert_called_once()
+    
     @patch('pdf_service_client.time.sleep')
     @patch('pdf_service_client.requests.Session')
     def test_convert_with_retry_all_attempts_fail(self, mock_session_class, mock_sleep):
@@ -262,6 +472,24 @@ class TestPDFServiceClient:
             client.convert_to_pdf_with_retry(b"test content", max_attempts=2)
         
         assert mock_session.post.call_count == 2
+    
+    @patch('pdf_service_client.time.sleep')
+    @patch('pdf_service_client.requests.Session')
+    def test_convert_with_retry_no_retry_on_connection_error(self, mock_session_class, mock_sleep):
+        """Test connection errors are left to the session's retry adapter"""
+        mock_session = Mock()
+        mock_session.post.side_effect = requests.ConnectionError("Connection refused")
+        mock_session_class.return_value = mock_session
+        
+        client = PDFServiceClient(max_retries=3)
+        client.session = mock_session
+        
+        with pytest.raises(PDFServiceError) as exc_info:
+            client.convert_to_pdf_with_retry(b"test content")
+        
+        assert exc_info.value.error_code == "CONNECTION_ERROR"
+        assert mock_session.post.call_count == 1
+        mock_sleep.assert_not_called()
 
 
 def test_create_pdf_service_client():
@@ -275,5 +503,30 @@ def test_create_pdf_service_client():
         assert client.timeout == 45
 
 
+@patch('pdf_service_client.requests.Session')
+def test_benchmark_health(mock_session_class):
+    """Test health benchmark issues repeat x parallel requests and reports percentiles"""
+    client = PDFServiceClient(service_url="http://localhost:5000")
+    client_session = client.session
+    client_session.reset_mock()
+    mock_session = Mock()
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_session.get.return_value = mock_response
+    mock_session_class.return_value = mock_session
+    
+    stats = benchmark_health(client, repeat=5, parallel=2)
+    
+    assert mock_session.get.call_count == 10
+    assert stats['n'] == 10
+    assert stats['errors'] == 0
+    assert stats['p50'] <= stats['p95'] <= stats['p99']
+    # The benchmark runs on its own session; the client's is not modified
+    assert client.session is client_session
+    client_session.mount.assert_not_called()
+    client_session.get.assert_not_called()
+    mock_session.close.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -13,9 +13,6 @@ import json
 import base64
 from unittest.mock import Mock, patch, MagicMock
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 # Test data
 TEST_DOCUMENT_DATA = {
     'title': 'Test Paper',
@@ -169,11 +166,7 @@ def test_word_generation_unchanged():
         from ieee_generator_fixed import generate_ieee_document
         
         # This should work regardless of PDF service availability
-        docx_data = {
-            'title': 'Test Paper',
-            'authors': ['Test Author'],
-            'abstract': 'Test abstract'
-        }
+        docx_data = {key: TEST_DOCUMENT_DATA[key] for key in ('title', 'authors', 'abstract')}
         
         # Mock the actual generation (we're just testing the interface)
         print("✅ Word generation interface unchanged")
@@ -208,18 +201,20 @@ def run_all_tests():
             print(f"❌ Test failed with exception: {e}")
             results.append(False)
     
-    print("\n" + "=" * 60)
-    print(f"Test Results: {sum(results)}/{len(results)} passed")
-    print("=" * 60)
+    # Emit the summary in one write rather than one print per line
+    sys.stdout.write("".join([
+        "\n" + "=" * 60 + "\n",
+        f"Test Results: {sum(results)}/{len(results)} passed\n",
+        "=" * 60 + "\n",
+        "✅ All tests passed!\n" if all(results) else "❌ Some tests failed\n",
+    ]))
     
-    if all(results):
-        print("✅ All tests passed!")
-        return 0
-    else:
-        print("❌ Some tests failed")
-        return 1
+    return 0 if all(results) else 1
 
 
 if __name__ == '__main__':
     exit_code = run_all_tests()
+    # Make sure the summary reaches buffered CI pipes before exiting
+    sys.stdout.flush()
+    sys.stderr.flush()
     sys.exit(exit_code)